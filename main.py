@@ -4,18 +4,184 @@ File Process Tracker - Main script
 File processing tracking and management system
 """
 import sys
+import functools
 import click
 from pathlib import Path
 from datetime import datetime
 import json as json_module
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from src.config_loader import Config
 from src.database import DatabaseManager
-from src.file_processor import FileProcessor
-from src.logger import setup_logging
+from src.logger import setup_logging, get_null_logger
+
+
+def print_json(data):
+    """
+    Print data as indented JSON on standard output
+
+    Args:
+        data: JSON-serializable data (datetimes are supported)
+    """
+    if ORJSON_AVAILABLE:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        )
+        sys.stdout.flush()
+    else:
+        # Same datetime format as orjson (ISO 8601)
+        print(json_module.dumps(
+            data,
+            indent=2,
+            default=lambda obj: obj.isoformat() if isinstance(obj, datetime) else str(obj)
+        ))
+
+
+def handle_errors(func):
+    """
+    Decorator reporting command errors in text or JSON format
+
+    Exits with code 1 for missing files and configuration errors,
+    and with code 2 for unexpected errors.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        json = click.get_current_context().obj['json']
+        try:
+            return func(*args, **kwargs)
+
+        except FileNotFoundError as e:
+            if not json:
+                click.echo(f"Error: {str(e)}", err=True)
+            else:
+                print_json({'error': str(e)})
+            sys.exit(1)
+
+        except ValueError as e:
+            if not json:
+                click.echo(f"Configuration error: {str(e)}", err=True)
+            else:
+                print_json({'error': str(e)})
+            sys.exit(1)
+
+        except Exception as e:
+            if not json:
+                click.echo(f"Unexpected error: {str(e)}", err=True)
+            else:
+                print_json({'error': str(e), 'type': type(e).__name__})
+            sys.exit(2)
+
+    return wrapper
+
+
+def load_config(options: dict, **cli_overrides):
+    """
+    Load the configuration and set up logging
+
+    Args:
+        options: Group-level options (config, log_level, json)
+        **cli_overrides: Command-specific CLI overrides
+
+    Returns:
+        Tuple (configuration, logger)
+    """
+    # Load configuration
+    cfg = Config(options['config'])
+
+    # Apply CLI overrides
+    cfg.apply_cli_overrides(log_level=options['log_level'], **cli_overrides)
+
+    # Logging configuration (JSON output mode opens no console or log file)
+    if options['json']:
+        return cfg, get_null_logger()
+
+    logger = setup_logging(
+        level=cfg.log_level,
+        log_file=cfg.log_file,
+        log_format=cfg.log_format,
+        max_bytes=cfg.log_max_bytes,
+        rotation_count=cfg.log_rotation_count,
+        console=True
+    )
+
+    if cfg.dry_run:
+        logger.info("=== DRY-RUN MODE ENABLED ===")
+
+    logger.debug(cfg.summary())
 
+    return cfg, logger
 
-@click.command()
+
+def create_processor(cfg: Config, db: DatabaseManager):
+    """
+    Create the file processor from the configuration
+
+    Args:
+        cfg: Active configuration
+        db: Open database manager
+
+    Returns:
+        File processor
+    """
+    # Imported here so that commands which don't copy files don't pay for it
+    from src.file_processor import FileProcessor
+
+    return FileProcessor(
+        db_manager=db,
+        source_dir=cfg.source_dir,
+        target_dir=cfg.target_dir,
+        batch_size=cfg.batch_size,
+        compute_hash=cfg.compute_hash,
+        hash_algorithm=cfg.hash_algorithm,
+        exclude_patterns=cfg.exclude_patterns,
+        include_patterns=cfg.include_patterns,
+        recursive=cfg.recursive,
+        dry_run=cfg.dry_run,
+        verify_hash=cfg.verify_hash,
+        sort=cfg.sort_files
+    )
+
+
+@click.group(invoke_without_command=True)
+@click.option(
+    '--config',
+    type=click.Path(exists=True),
+    default='config/config.yaml',
+    help='Configuration file to use'
+)
+@click.option(
+    '--log-level',
+    type=click.Choice(['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']),
+    help='Log level'
+)
+@click.option(
+    '--json',
+    is_flag=True,
+    help='JSON format output'
+)
+@click.pass_context
+def main(ctx, config, log_level, json: bool):
+    """
+    File Process Tracker - File processing tracking system
+
+    Batch copy files from a source directory to a target directory,
+    with database recording to avoid duplicates.
+
+    Without a command, runs the processing with default options.
+    """
+    ctx.obj = {'config': config, 'log_level': log_level, 'json': json}
+
+    if ctx.invoked_subcommand is None:
+        ctx.invoke(run)
+
+
+@main.command()
 @click.option(
     '--batch-size',
     type=int,
@@ -33,9 +199,14 @@ from src.logger import setup_logging
 )
 @click.option(
     '--hash-algorithm',
-    type=click.Choice(['xxhash', 'sha256']),
+    type=click.Choice(['xxh3', 'xxhash', 'blake2b', 'blake3', 'sha256']),
     help='Hash algorithm to use'
 )
+@click.option(
+    '--verify',
+    is_flag=True,
+    help='Re-read each copy and compare its hash with the source (with --compute-hash)'
+)
 @click.option(
     '--exclude',
     multiple=True,
@@ -46,231 +217,159 @@ from src.logger import setup_logging
     multiple=True,
     help='File pattern to include (can be used multiple times)'
 )
-@click.option(
-    '--log-level',
-    type=click.Choice(['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']),
-    help='Log level'
-)
-@click.option(
-    '--config',
-    type=click.Path(exists=True),
-    default='config/config.yaml',
-    help='Configuration file to use'
-)
-@click.option(
-    '--check-integrity',
-    is_flag=True,
-    help='Check database integrity'
-)
-@click.option(
-    '--list-processed',
-    is_flag=True,
-    help='List already processed files'
-)
-@click.option(
-    '--stats',
-    is_flag=True,
-    help='Display processing statistics'
-)
-@click.option(
-    '--clean-orphans',
-    is_flag=True,
-    help='Delete files from target that are not in the database'
-)
-@click.option(
-    '--json',
-    is_flag=True,
-    help='JSON format output'
-)
-def main(
-    batch_size,
-    dry_run,
-    compute_hash,
-    hash_algorithm,
-    exclude,
-    include,
-    log_level,
-    config,
-    check_integrity,
-    list_processed,
-    stats,
-    clean_orphans,
-    json: bool
-):
-    """
-    File Process Tracker - File processing tracking system
+@click.pass_obj
+@handle_errors
+def run(options, batch_size, dry_run, compute_hash, hash_algorithm, verify, exclude, include):
+    """Copy the next batch of unprocessed files"""
+    json = options['json']
+    cfg, logger = load_config(
+        options,
+        batch_size=batch_size,
+        # Unset flags are passed as None so that they don't override the configuration
+        dry_run=dry_run or None,
+        compute_hash=compute_hash or None,
+        hash_algorithm=hash_algorithm,
+        verify=verify or None,
+        exclude=exclude,
+        include=include,
+    )
 
-    Batch copy files from a source directory to a target directory,
-    with database recording to avoid duplicates.
-    """
-    try:
-        # Load configuration
-        cfg = Config(config)
-
-        # Apply CLI overrides
-        cli_overrides = {
-            'batch_size': batch_size,
-            'dry_run': dry_run,
-            'compute_hash': compute_hash,
-            'hash_algorithm': hash_algorithm,
-            'exclude': exclude,
-            'include': include,
-            'log_level': log_level,
-        }
-        cfg.apply_cli_overrides(**cli_overrides)
-
-        # Logging configuration
-        if not json:
-            logger = setup_logging(
-                level=cfg.log_level,
-                log_file=cfg.log_file,
-                log_format=cfg.log_format,
-                max_bytes=cfg.log_max_bytes,
-                rotation_count=cfg.log_rotation_count,
-                console=True
-            )
-
-            if dry_run or cfg.dry_run:
-                logger.info("=== DRY-RUN MODE ENABLED ===")
-
-            logger.debug(cfg.summary())
-
-        # Database connection
-        with DatabaseManager(cfg.database_path) as db:
-
-            # Integrity check mode
-            if check_integrity:
-                result = db.check_integrity()
-                if json:
-                    print(json_module.dumps(result, indent=2, default=str))
-                else:
-                    logger.info("=== Integrity Check ===")
-                    logger.info(f"Status: {result['status']}")
-                    logger.info(f"SQLite integrity: {result['integrity_check']}")
-                    if result['duplicates']:
-                        logger.warning(f"Duplicates detected: {result['duplicate_count']}")
-                        for dup in result['duplicates']:
-                            logger.warning(f"  - {dup['filename']} ({dup['count']} times)")
-                return
-
-            # List processed files mode
-            if list_processed:
-                files = db.get_processed_files(limit=100)
-                if json:
-                    print(json_module.dumps(files, indent=2, default=str))
-                else:
-                    logger.info(f"=== Last processed files ({len(files)}) ===")
-                    for f in files:
-                        size_mb = f['size'] / (1024 * 1024)
-                        logger.info(
-                            f"  {f['filename']} - {size_mb:.2f} MB - "
-                            f"{f['copy_date']}"
-                        )
-                return
-
-            # Statistics mode
-            if stats:
-                statistics = db.get_statistics()
-                if json:
-                    print(json_module.dumps(statistics, indent=2, default=str))
-                else:
-                    logger.info("=== Statistics ===")
-                    logger.info(f"Processed files: {statistics['total_files']}")
-                    logger.info(f"Total size: {statistics['total_size_gb']} GB")
-                    logger.info(f"Logged errors: {statistics['total_errors']}")
-                    if statistics['last_copy']:
-                        logger.info(f"Last copy: {statistics['last_copy']}")
-                return
-
-            # File processor initialization
-            processor = FileProcessor(
-                db_manager=db,
-                source_dir=cfg.source_dir,
-                target_dir=cfg.target_dir,
-                batch_size=cfg.batch_size,
-                compute_hash=cfg.compute_hash,
-                hash_algorithm=cfg.hash_algorithm,
-                exclude_patterns=cfg.exclude_patterns,
-                include_patterns=cfg.include_patterns,
-                recursive=cfg.recursive,
-                dry_run=cfg.dry_run
-            )
-
-            # Orphan cleanup mode
-            if clean_orphans:
-                if not json:
-                    logger.info("=== Orphan Files Cleanup ===")
-                deleted = processor.clean_target_orphans()
-                if json:
-                    print(json_module.dumps({'deleted': deleted}, indent=2))
-                else:
-                    logger.info(f"Orphan files deleted: {deleted}")
-                return
-
-            # Normal processing mode - file copying
-            if not json:
-                logger.info("=== Starting Processing ===")
-
-            result = processor.process_batch()
-
-            # Display results
-            if json:
-                # Remove file lists to lighten JSON output
-                compact_result = {
-                    'processed': result['processed'],
-                    'skipped': result['skipped'],
-                    'errors': result['errors'],
-                    'total_size_mb': result['total_size'] / (1024 * 1024),
-                    'duration': result.get('duration', 0)
-                }
-                print(json_module.dumps(compact_result, indent=2))
+    with DatabaseManager(cfg.database_path) as db:
+        processor = create_processor(cfg, db)
+
+        # Normal processing mode - file copying
+        logger.info("=== Starting Processing ===")
+
+        result = processor.process_batch()
+
+        # Display results
+        if json:
+            # Remove file lists to lighten JSON output
+            compact_result = {
+                'processed': result['processed'],
+                'skipped': result['skipped'],
+                'errors': result['errors'],
+                'total_size_mb': result['total_size'] / (1024 * 1024),
+                'duration': result.get('duration', 0)
+            }
+            print_json(compact_result)
+        else:
+            logger.info("=== Processing Summary ===")
+            logger.info(f"Processed files: {result['processed']}")
+            logger.info(f"Skipped files: {result['skipped']}")
+            logger.info(f"Errors: {result['errors']}")
+
+            total_size_mb = result['total_size'] / (1024 * 1024)
+            if total_size_mb > 1024:
+                total_size_gb = total_size_mb / 1024
+                logger.info(f"Total size copied: {total_size_gb:.2f} GB")
             else:
-                logger.info("=== Processing Summary ===")
-                logger.info(f"Processed files: {result['processed']}")
-                logger.info(f"Skipped files: {result['skipped']}")
-                logger.info(f"Errors: {result['errors']}")
-
-                total_size_mb = result['total_size'] / (1024 * 1024)
-                if total_size_mb > 1024:
-                    total_size_gb = total_size_mb / 1024
-                    logger.info(f"Total size copied: {total_size_gb:.2f} GB")
-                else:
-                    logger.info(f"Total size copied: {total_size_mb:.2f} MB")
-
-                if result.get('duration'):
-                    logger.info(f"Duration: {result['duration']:.2f} seconds")
-
-                # Error details if present
-                if result['files_errors']:
-                    logger.warning("Error details:")
-                    for error_info in result['files_errors']:
-                        logger.warning(f"  - {error_info['file']}: {error_info['error']}")
-
-            # Exit code
-            if result['errors'] > 0:
-                sys.exit(1)
-
-    except FileNotFoundError as e:
-        if not json:
-            click.echo(f"Error: {str(e)}", err=True)
+                logger.info(f"Total size copied: {total_size_mb:.2f} MB")
+
+            if result.get('duration'):
+                logger.info(f"Duration: {result['duration']:.2f} seconds")
+
+            # Error details if present
+            if result['files_errors']:
+                logger.warning("Error details:\n" + "\n".join(
+                    f"  - {error_info['file']}: {error_info['error']}"
+                    for error_info in result['files_errors']
+                ))
+
+        # Exit code
+        if result['errors'] > 0:
+            sys.exit(1)
+
+
+@main.command()
+@click.pass_obj
+@handle_errors
+def stats(options):
+    """Display processing statistics"""
+    json = options['json']
+    cfg, logger = load_config(options)
+
+    with DatabaseManager(cfg.database_path) as db:
+        statistics = db.get_statistics()
+        if json:
+            print_json(statistics)
+        else:
+            logger.info("=== Statistics ===")
+            logger.info(f"Processed files: {statistics['total_files']}")
+            logger.info(f"Total size: {statistics['total_size_gb']} GB")
+            logger.info(f"Logged errors: {statistics['total_errors']}")
+            if statistics['last_copy']:
+                logger.info(f"Last copy: {statistics['last_copy']}")
+
+
+@main.command('list-processed')
+@click.pass_obj
+@handle_errors
+def list_processed(options):
+    """List already processed files"""
+    json = options['json']
+    cfg, logger = load_config(options)
+
+    with DatabaseManager(cfg.database_path) as db:
+        if json:
+            files = db.get_processed_files(limit=100)
+            print_json(files)
         else:
-            print(json_module.dumps({'error': str(e)}, indent=2))
-        sys.exit(1)
+            count = min(100, db.count_processed_files())
+            logger.info(f"=== Last processed files ({count}) ===")
+            for f in db.iter_processed_files(limit=100, date_as_text=True):
+                size_mb = f['size'] / (1024 * 1024)
+                logger.info(
+                    f"  {f['filename']} - {size_mb:.2f} MB - "
+                    f"{f['copy_date']}"
+                )
+
+
+@main.command('check-integrity')
+@click.pass_obj
+@handle_errors
+def check_integrity(options):
+    """Check database integrity"""
+    json = options['json']
+    cfg, logger = load_config(options)
 
-    except ValueError as e:
-        if not json:
-            click.echo(f"Configuration error: {str(e)}", err=True)
+    with DatabaseManager(cfg.database_path) as db:
+        result = db.check_integrity()
+        if json:
+            print_json(result)
         else:
-            print(json_module.dumps({'error': str(e)}, indent=2))
-        sys.exit(1)
+            logger.info("=== Integrity Check ===")
+            logger.info(f"Status: {result['status']}")
+            logger.info(f"SQLite integrity: {result['integrity_check']}")
+            if result['duplicates']:
+                logger.warning(f"Duplicates detected: {result['duplicate_count']}")
+                for dup in result['duplicates']:
+                    logger.warning(f"  - {dup['filename']} ({dup['count']} times)")
+
+
+@main.command('clean-orphans')
+@click.option(
+    '--dry-run',
+    is_flag=True,
+    help='Simulation mode - shows what would be deleted without doing it'
+)
+@click.pass_obj
+@handle_errors
+def clean_orphans(options, dry_run):
+    """Delete files from target that are not in the database"""
+    json = options['json']
+    cfg, logger = load_config(options, dry_run=dry_run or None)
+
+    with DatabaseManager(cfg.database_path) as db:
+        processor = create_processor(cfg, db)
 
-    except Exception as e:
-        if not json:
-            click.echo(f"Unexpected error: {str(e)}", err=True)
+        logger.info("=== Orphan Files Cleanup ===")
+        deleted = processor.clean_target_orphans()
+        if json:
+            print_json({'deleted': deleted})
         else:
-            print(json_module.dumps({'error': str(e), 'type': type(e).__name__}, indent=2))
-        sys.exit(2)
+            logger.info(f"Orphan files deleted: {deleted}")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
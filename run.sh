@@ -1,7 +1,7 @@
 #!/bin/bash
 
 # Script de lancement simple pour Docker
-# Usage: ./run.sh [OPTIONS]
+# Usage: ./run.sh [--build] [OPTIONS] [COMMAND] [COMMAND OPTIONS]
 
 set -e
 
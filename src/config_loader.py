@@ -2,18 +2,58 @@
 Configuration loading and management module
 """
 import os
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 import yaml
 from dotenv import load_dotenv
 import logging
 
+# Use the libyaml C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 logger = logging.getLogger(__name__)
 
 
+# Accepted spellings of boolean values in environment variables
+_BOOL_TRUE = frozenset({'true', 'yes', '1'})
+_BOOL_FALSE = frozenset({'false', 'no', '0'})
+
+
 class Config:
     """Configuration manager for File Process Tracker"""
 
+    # Environment variable -> configuration path
+    _ENV_MAPPINGS = {
+        'SOURCE_DIR': ('source_dir',),
+        'TARGET_DIR': ('target_dir',),
+        'DATABASE_PATH': ('database', 'path'),
+        'BATCH_SIZE': ('processing', 'batch_size'),
+        'COMPUTE_HASH': ('hash', 'compute'),
+        'HASH_ALGORITHM': ('hash', 'algorithm'),
+        'VERIFY_HASH': ('hash', 'verify'),
+        'LOG_LEVEL': ('logging', 'level'),
+        'LOG_FILE': ('logging', 'file'),
+        'DRY_RUN': ('execution', 'dry_run'),
+        'RECURSIVE': ('processing', 'recursive'),
+        'SORT_FILES': ('processing', 'sort'),
+    }
+
+    # CLI argument -> configuration path
+    _CLI_MAPPINGS = {
+        'batch_size': ('processing', 'batch_size'),
+        'dry_run': ('execution', 'dry_run'),
+        'compute_hash': ('hash', 'compute'),
+        'hash_algorithm': ('hash', 'algorithm'),
+        'verify': ('hash', 'verify'),
+        'log_level': ('logging', 'level'),
+        'exclude': ('exclude_patterns',),
+        'include': ('include_patterns',),
+    }
+
     def __init__(self, config_path: str = "config/config.yaml"):
         """
         Initialize the configuration
@@ -38,30 +78,17 @@ class Config:
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
 
         with open(self.config_path, 'r', encoding='utf-8') as f:
-            self.config = yaml.safe_load(f)
+            self.config = yaml.load(f, Loader=SafeLoader)
 
         logger.info(f"Configuration loaded from: {self.config_path}")
 
     def _apply_env_overrides(self):
         """Apply overrides from environment variables"""
-        env_mappings = {
-            'SOURCE_DIR': ('source_dir',),
-            'TARGET_DIR': ('target_dir',),
-            'DATABASE_PATH': ('database', 'path'),
-            'BATCH_SIZE': ('processing', 'batch_size'),
-            'COMPUTE_HASH': ('hash', 'compute'),
-            'HASH_ALGORITHM': ('hash', 'algorithm'),
-            'LOG_LEVEL': ('logging', 'level'),
-            'LOG_FILE': ('logging', 'file'),
-            'DRY_RUN': ('execution', 'dry_run'),
-            'RECURSIVE': ('processing', 'recursive'),
-        }
-
-        for env_var, config_path in env_mappings.items():
-            env_value = os.getenv(env_var)
-            if env_value is not None:
-                self._set_nested_value(config_path, self._parse_value(env_value))
-                logger.debug(f"Environment variable applied: {env_var}")
+        # Only visit the mapped variables that are actually set
+        env = os.environ
+        for env_var in self._ENV_MAPPINGS.keys() & env.keys():
+            self._set_nested_value(self._ENV_MAPPINGS[env_var], self._parse_value(env[env_var]))
+            logger.debug(f"Environment variable applied: {env_var}")
 
     def _parse_value(self, value: str) -> Any:
         """
@@ -74,9 +101,10 @@ class Config:
             Parsed value
         """
         # Boolean
-        if value.lower() in ('true', 'yes', '1'):
+        lowered = value.lower()
+        if lowered in _BOOL_TRUE:
             return True
-        elif value.lower() in ('false', 'no', '0'):
+        elif lowered in _BOOL_FALSE:
             return False
 
         # Number
@@ -104,6 +132,11 @@ class Config:
             current = current[key]
         current[path[-1]] = value
 
+        # Drop cached property values, they may depend on the updated key
+        for name, attr in vars(type(self)).items():
+            if isinstance(attr, cached_property):
+                self.__dict__.pop(name, None)
+
     def _validate_config(self):
         """Validate the loaded configuration"""
         # Required environment variables
@@ -161,17 +194,7 @@ class Config:
         Args:
             **kwargs: CLI arguments to apply
         """
-        cli_mappings = {
-            'batch_size': ('processing', 'batch_size'),
-            'dry_run': ('execution', 'dry_run'),
-            'compute_hash': ('hash', 'compute'),
-            'hash_algorithm': ('hash', 'algorithm'),
-            'log_level': ('logging', 'level'),
-            'exclude': ('exclude_patterns',),
-            'include': ('include_patterns',),
-        }
-
-        for cli_arg, config_path in cli_mappings.items():
+        for cli_arg, config_path in self._CLI_MAPPINGS.items():
             if cli_arg in kwargs and kwargs[cli_arg] is not None:
                 value = kwargs[cli_arg]
 
@@ -192,77 +215,87 @@ class Config:
 
     # Properties for easy access to common configurations
 
-    @property
+    @cached_property
     def source_dir(self) -> str:
         """Source directory for files"""
         return self.config.get('source_dir', '')
 
-    @property
+    @cached_property
     def target_dir(self) -> str:
         """Target directory for copies"""
         return self.config.get('target_dir', '')
 
-    @property
+    @cached_property
     def database_path(self) -> str:
         """Database path"""
         return self.get_nested_value(('database', 'path'), 'data/file_tracker.db')
 
-    @property
+    @cached_property
     def batch_size(self) -> int:
         """Number of files to process per batch"""
         return self.get_nested_value(('processing', 'batch_size'), 10)
 
-    @property
+    @cached_property
     def recursive(self) -> bool:
         """Recursive traversal of subdirectories"""
         return self.get_nested_value(('processing', 'recursive'), True)
 
-    @property
+    @cached_property
+    def sort_files(self) -> bool:
+        """Process files in alphabetical order of their name"""
+        return self.get_nested_value(('processing', 'sort'), True)
+
+    @cached_property
     def compute_hash(self) -> bool:
         """Enable hash computation"""
         return self.get_nested_value(('hash', 'compute'), False)
 
-    @property
+    @cached_property
     def hash_algorithm(self) -> str:
         """Hash algorithm to use"""
-        return self.get_nested_value(('hash', 'algorithm'), 'xxhash')
+        return self.get_nested_value(('hash', 'algorithm'), 'xxh3')
+
+    @cached_property
+    def verify_hash(self) -> bool:
+        """Re-read copied files and compare their hash with the source"""
+        return self.get_nested_value(('hash', 'verify'), False)
 
-    @property
+    @cached_property
     def exclude_patterns(self) -> List[str]:
         """File patterns to exclude"""
         return self.get_nested_value(('exclude_patterns',), [])
 
-    @property
+    @cached_property
     def include_patterns(self) -> List[str]:
         """File patterns to include"""
         return self.get_nested_value(('include_patterns',), [])
 
-    @property
+    @cached_property
     def dry_run(self) -> bool:
         """Simulation mode without actual copy"""
         return self.get_nested_value(('execution', 'dry_run'), False)
 
-    @property
+    @cached_property
     def log_level(self) -> str:
         """Log level"""
         return self.get_nested_value(('logging', 'level'), 'INFO')
 
-    @property
+    @cached_property
     def log_file(self) -> str:
         """Log file"""
         return self.get_nested_value(('logging', 'file'), 'logs/file_processor.log')
 
-    @property
+    @cached_property
     def log_rotation_count(self) -> int:
         """Number of log files to keep"""
         return self.get_nested_value(('logging', 'rotation_count'), 7)
 
-    @property
+    @cached_property
     def log_max_bytes(self) -> int:
         """Maximum size of a log file"""
         return self.get_nested_value(('logging', 'max_bytes'), 10485760)
 
-    @property
+    @cached_property
     def log_format(self) -> str:
         """Log message format"""
         return self.get_nested_value(
@@ -2,29 +2,54 @@
 SQLite database management module
 """
 import sqlite3
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, Iterator, List, Dict, Any, Set, Tuple, Union
 import logging
 
 logger = logging.getLogger(__name__)
 
 # Configure SQLite datetime adapters for Python 3.12+ compatibility
 def adapt_datetime(dt):
-    """Convert datetime to ISO 8601 string for SQLite storage"""
-    return dt.isoformat()
+    """Convert datetime to a Unix epoch integer for SQLite storage"""
+    return int(dt.timestamp())
 
 def convert_datetime(s):
-    """Convert ISO 8601 string from SQLite to datetime object"""
-    return datetime.fromisoformat(s.decode())
+    """Convert a Unix epoch integer from SQLite to datetime object"""
+    return datetime.fromtimestamp(int(s))
 
 # Register the adapters and converters
+# (converter applied to columns selected as "name [epoch]")
 sqlite3.register_adapter(datetime, adapt_datetime)
-sqlite3.register_converter("timestamp", convert_datetime)
+sqlite3.register_converter("epoch", convert_datetime)
+
+# Version stored in PRAGMA user_version, see _initialize_database
+# 1: dates stored as Unix epoch integers instead of ISO 8601 strings
+SCHEMA_VERSION = 1
+
+# Above this number of file names, lookups use a temporary table
+# rather than an IN clause with one parameter per name
+IN_CLAUSE_MAX_SIZE = 500
+
+# Connection tuning applied once when the connection is opened
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MB
+    "PRAGMA cache_size=-65536",  # 64 MB
+)
 
 
 class DatabaseManager:
-    """SQLite database manager for file tracking"""
+    """
+    SQLite database manager for file tracking
+
+    A single cursor is reused by all queries, so an instance must not be
+    used from several threads at the same time. Iterators (iter_*) run on
+    their own cursor and can be consumed while other queries are issued.
+    """
 
     def __init__(self, db_path: str):
         """
@@ -36,56 +61,170 @@ class DatabaseManager:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.connection: Optional[sqlite3.Connection] = None
+        self._cursor: Optional[sqlite3.Cursor] = None
+        self._stats_cache: Optional[Dict[str, Any]] = None
         self._initialize_database()
 
     def _initialize_database(self):
-        """Create tables if they don't exist"""
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
+        """Open the connection and create or upgrade the schema if needed"""
+        cursor = self._get_cursor()
+
+        # Up-to-date databases are opened without writing (nor taking the
+        # write lock), so that read-only commands never wait for a writer
+        if self._read_schema_state(cursor) == (SCHEMA_VERSION, True):
+            logger.info(f"Database opened: {self.db_path}")
+            return
+
+        cursor.execute("BEGIN IMMEDIATE")
+        # Read again under the lock, another process may have upgraded it
+        user_version, _ = self._read_schema_state(cursor)
+
+        # Processed files table
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS processed_files (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                filename TEXT UNIQUE NOT NULL,
+                source_path TEXT NOT NULL,
+                target_path TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                copy_date INTEGER NOT NULL,
+                hash TEXT,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+        # The UNIQUE constraint already indexes filename: drop the redundant
+        # indexes created by earlier versions
+        cursor.execute("DROP INDEX IF EXISTS idx_filename")
+        cursor.execute("DROP INDEX IF EXISTS idx_copy_date")
+
+        # Covering index for listing and statistics queries
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_copy_date_incl
+            ON processed_files (copy_date DESC, filename, size)
+        """)
+
+        # Errors table
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS errors (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp INTEGER NOT NULL,
+                filename TEXT NOT NULL,
+                error_type TEXT NOT NULL,
+                error_message TEXT NOT NULL,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+        # Running totals, kept up to date by triggers so that statistics
+        # never need to scan the tables
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS counters (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                total_files INTEGER NOT NULL,
+                total_size INTEGER NOT NULL,
+                total_errors INTEGER NOT NULL,
+                last_copy INTEGER
+            )
+        """)
 
-            # Processed files table
+        # Seed from existing data (databases created by earlier versions)
+        cursor.execute("SELECT 1 FROM counters")
+        if cursor.fetchone() is None:
             cursor.execute("""
-                CREATE TABLE IF NOT EXISTS processed_files (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    filename TEXT UNIQUE NOT NULL,
-                    source_path TEXT NOT NULL,
-                    target_path TEXT NOT NULL,
-                    size INTEGER NOT NULL,
-                    copy_date DATETIME NOT NULL,
-                    hash TEXT,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
+                INSERT INTO counters (id, total_files, total_size, total_errors, last_copy)
+                SELECT 1, COUNT(*), COALESCE(SUM(size), 0),
+                       (SELECT COUNT(*) FROM errors), MAX(copy_date)
+                FROM processed_files
             """)
 
-            # Index to improve performance
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_processed_files_insert
+            AFTER INSERT ON processed_files
+            BEGIN
+                UPDATE counters SET
+                    total_files = total_files + 1,
+                    total_size = total_size + NEW.size,
+                    last_copy = MAX(COALESCE(last_copy, NEW.copy_date), NEW.copy_date);
+            END
+        """)
+
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_processed_files_delete
+            AFTER DELETE ON processed_files
+            BEGIN
+                UPDATE counters SET
+                    total_files = total_files - 1,
+                    total_size = total_size - OLD.size,
+                    last_copy = (SELECT MAX(copy_date) FROM processed_files);
+            END
+        """)
+
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_errors_insert
+            AFTER INSERT ON errors
+            BEGIN
+                UPDATE counters SET total_errors = total_errors + 1;
+            END
+        """)
+
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_errors_delete
+            AFTER DELETE ON errors
+            BEGIN
+                UPDATE counters SET total_errors = total_errors - 1;
+            END
+        """)
+
+        # Convert the ISO 8601 dates written by earlier versions
+        if user_version < 1:
             cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_filename
-                ON processed_files (filename)
+                UPDATE processed_files
+                SET copy_date = CAST(strftime('%s', copy_date, 'utc') AS INTEGER)
+                WHERE typeof(copy_date) = 'text'
             """)
-
             cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_copy_date
-                ON processed_files (copy_date)
+                UPDATE errors
+                SET timestamp = CAST(strftime('%s', timestamp, 'utc') AS INTEGER)
+                WHERE typeof(timestamp) = 'text'
             """)
-
-            # Errors table
             cursor.execute("""
-                CREATE TABLE IF NOT EXISTS errors (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp DATETIME NOT NULL,
-                    filename TEXT NOT NULL,
-                    error_type TEXT NOT NULL,
-                    error_message TEXT NOT NULL,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
+                UPDATE counters
+                SET last_copy = (SELECT MAX(copy_date) FROM processed_files)
             """)
+        if user_version != SCHEMA_VERSION:
+            cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
 
-            conn.commit()
-            logger.info(f"Database initialized: {self.db_path}")
+        cursor.execute("COMMIT")
+        logger.info(f"Database initialized: {self.db_path}")
+
+    @staticmethod
+    def _read_schema_state(cursor: sqlite3.Cursor) -> Tuple[int, bool]:
+        """
+        Read the schema version and whether the counters row exists
+
+        Args:
+            cursor: Cursor to use
+
+        Returns:
+            Tuple (user_version, counters row present)
+        """
+        cursor.execute("PRAGMA user_version")
+        user_version = cursor.fetchone()[0]
+
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'counters'")
+        if cursor.fetchone() is None:
+            return user_version, False
+        cursor.execute("SELECT 1 FROM counters")
+        return user_version, cursor.fetchone() is not None
 
     def _get_connection(self) -> sqlite3.Connection:
         """
-        Get a database connection
+        Get the database connection, opening it on first use
+
+        The connection is kept open for the lifetime of the manager and runs
+        in autocommit mode: each statement commits on its own unless it is
+        wrapped in an explicit transaction (see begin_transaction).
 
         Returns:
             SQLite connection
@@ -93,16 +232,33 @@ class DatabaseManager:
         if self.connection is None:
             self.connection = sqlite3.connect(
                 str(self.db_path),
-                detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES
+                detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+                isolation_level=None,
+                check_same_thread=False,
+                cached_statements=256
             )
             self.connection.row_factory = sqlite3.Row
+            for pragma in CONNECTION_PRAGMAS:
+                self.connection.execute(pragma)
+            self._cursor = self.connection.cursor()
         return self.connection
 
+    def _get_cursor(self) -> sqlite3.Cursor:
+        """
+        Get the shared cursor, reopening the connection if it was closed
+
+        Returns:
+            SQLite cursor
+        """
+        self._get_connection()
+        return self._cursor
+
     def close(self):
         """Close the database connection"""
         if self.connection:
             self.connection.close()
             self.connection = None
+            self._cursor = None
             logger.debug("Database connection closed")
 
     def is_file_processed(self, filename: str) -> bool:
@@ -115,13 +271,42 @@ class DatabaseManager:
         Returns:
             True if the file has already been processed, False otherwise
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT 1 FROM processed_files WHERE filename = ?",
-                (filename,)
-            )
-            return cursor.fetchone() is not None
+        cursor = self._get_cursor()
+        cursor.execute(
+            "SELECT 1 FROM processed_files WHERE filename = ?",
+            (filename,)
+        )
+        return cursor.fetchone() is not None
+
+    def count_processed_files(self) -> int:
+        """
+        Count the files recorded in the database
+
+        Returns:
+            Number of processed files
+        """
+        cursor = self._get_cursor()
+        cursor.execute("SELECT total_files FROM counters")
+        return cursor.fetchone()[0]
+
+    def iter_filenames(self) -> Iterator[str]:
+        """
+        Iterate over the names of all processed files
+
+        Yields:
+            Processed file names, streamed row by row
+        """
+        for row in self._get_connection().execute("SELECT filename FROM processed_files"):
+            yield row[0]
+
+    def load_processed_filenames(self) -> Set[str]:
+        """
+        Load the names of all processed files in memory
+
+        Returns:
+            Set of processed file names
+        """
+        return set(self.iter_filenames())
 
     def add_processed_file(
         self,
@@ -129,7 +314,7 @@ class DatabaseManager:
         source_path: str,
         target_path: str,
         size: int,
-        copy_date: datetime,
+        copy_date: Union[datetime, int],
         file_hash: Optional[str] = None
     ) -> int:
         """
@@ -140,7 +325,7 @@ class DatabaseManager:
             source_path: Full source path
             target_path: Full target path
             size: File size in bytes
-            copy_date: Copy date and time
+            copy_date: Copy date and time (datetime or Unix epoch seconds)
             file_hash: File hash (optional)
 
         Returns:
@@ -149,18 +334,58 @@ class DatabaseManager:
         Raises:
             sqlite3.IntegrityError: If the file already exists
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
+        cursor = self._get_cursor()
+        cursor.execute("""
+            INSERT INTO processed_files
+            (filename, source_path, target_path, size, copy_date, hash)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, (filename, source_path, target_path, size, copy_date, file_hash))
+
+        self._stats_cache = None
+        file_id = cursor.lastrowid
+        logger.info(f"File registered: {filename} (ID: {file_id})")
+        return file_id
+
+    def add_processed_files(
+        self,
+        rows: List[Tuple[str, str, str, int, Union[datetime, int], Optional[str]]]
+    ) -> int:
+        """
+        Add several processed files to the database in a single statement
+
+        The insert is all-or-nothing: if any row fails, none of them are kept.
+
+        Args:
+            rows: Tuples of (filename, source_path, target_path, size,
+                copy_date, file_hash), copy_date being a datetime or Unix
+                epoch seconds
+
+        Returns:
+            Number of records created
+
+        Raises:
+            sqlite3.IntegrityError: If one of the files already exists
+        """
+        if not rows:
+            return 0
+
+        cursor = self._get_cursor()
+        cursor.execute("SAVEPOINT add_processed_files")
+        try:
+            cursor.executemany("""
                 INSERT INTO processed_files
                 (filename, source_path, target_path, size, copy_date, hash)
                 VALUES (?, ?, ?, ?, ?, ?)
-            """, (filename, source_path, target_path, size, copy_date, file_hash))
-            conn.commit()
+            """, rows)
+        except sqlite3.Error:
+            cursor.execute("ROLLBACK TO add_processed_files")
+            cursor.execute("RELEASE add_processed_files")
+            raise
+        cursor.execute("RELEASE add_processed_files")
+        self._stats_cache = None
 
-            file_id = cursor.lastrowid
-            logger.info(f"File registered: {filename} (ID: {file_id})")
-            return file_id
+        logger.info(f"Files registered: {len(rows)}")
+        return len(rows)
 
     def log_error(
         self,
@@ -179,18 +404,77 @@ class DatabaseManager:
         Returns:
             Error record ID
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO errors
-                (timestamp, filename, error_type, error_message)
-                VALUES (?, ?, ?, ?)
-            """, (datetime.now(), filename, error_type, error_message))
-            conn.commit()
+        cursor = self._get_cursor()
+        cursor.execute("""
+            INSERT INTO errors
+            (timestamp, filename, error_type, error_message)
+            VALUES (?, ?, ?, ?)
+        """, (datetime.now(), filename, error_type, error_message))
+
+        self._stats_cache = None
+        error_id = cursor.lastrowid
+        logger.error(f"Error logged for {filename}: {error_type}")
+        return error_id
+
+    def log_errors(self, rows: List[Tuple[str, str, str]]) -> int:
+        """
+        Log several errors to the database in a single statement
+
+        Args:
+            rows: Tuples of (filename, error_type, error_message)
 
-            error_id = cursor.lastrowid
+        Returns:
+            Number of error records created
+        """
+        if not rows:
+            return 0
+
+        timestamp = datetime.now()
+        cursor = self._get_cursor()
+        cursor.executemany("""
+            INSERT INTO errors
+            (timestamp, filename, error_type, error_message)
+            VALUES (?, ?, ?, ?)
+        """, [(timestamp, *row) for row in rows])
+        self._stats_cache = None
+
+        for filename, error_type, _ in rows:
             logger.error(f"Error logged for {filename}: {error_type}")
-            return error_id
+        return len(rows)
+
+    def iter_processed_files(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        date_as_text: bool = False
+    ) -> Iterator[sqlite3.Row]:
+        """
+        Iterate over processed files, most recent first
+
+        Rows are streamed from the database without being materialized.
+
+        Args:
+            limit: Maximum number of records to return
+            offset: Offset for pagination
+            date_as_text: Return copy_date as a local 'YYYY-MM-DD HH:MM:SS'
+                string formatted by SQLite, skipping the datetime conversion
+                (for display-only callers)
+
+        Yields:
+            Processed file rows (filename, size and copy_date)
+        """
+        if date_as_text:
+            copy_date = "datetime(copy_date, 'unixepoch', 'localtime') AS copy_date"
+        else:
+            copy_date = 'copy_date AS "copy_date [epoch]"'
+
+        # A negative LIMIT means no limit in SQLite
+        yield from self._get_connection().execute(f"""
+            SELECT filename, size, {copy_date}
+            FROM processed_files
+            ORDER BY processed_files.copy_date DESC
+            LIMIT ? OFFSET ?
+        """, (limit or -1, offset))
 
     def get_processed_files(
         self,
@@ -205,20 +489,9 @@ class DatabaseManager:
             offset: Offset for pagination
 
         Returns:
-            List of processed files
+            List of processed files (filename, size and copy_date)
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            query = """
-                SELECT * FROM processed_files
-                ORDER BY copy_date DESC
-            """
-
-            if limit:
-                query += f" LIMIT {limit} OFFSET {offset}"
-
-            cursor.execute(query)
-            return [dict(row) for row in cursor.fetchall()]
+        return [dict(row) for row in self.iter_processed_files(limit, offset)]
 
     def get_unprocessed_files(
         self,
@@ -236,50 +509,68 @@ class DatabaseManager:
         if not source_files:
             return []
 
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            placeholders = ','.join('?' * len(source_files))
+        cursor = self._get_cursor()
+
+        if len(source_files) > IN_CLAUSE_MAX_SIZE:
+            # Large lists go through a temporary table joined on the
+            # filename index instead of an oversized IN clause
+            cursor.execute("""
+                CREATE TEMP TABLE IF NOT EXISTS tmp_names (
+                    name TEXT PRIMARY KEY
+                )
+            """)
+            cursor.execute("DELETE FROM tmp_names")
+            cursor.executemany(
+                "INSERT OR IGNORE INTO tmp_names (name) VALUES (?)",
+                ((name,) for name in source_files)
+            )
+            cursor.execute("""
+                SELECT t.name FROM tmp_names t
+                LEFT JOIN processed_files f ON f.filename = t.name
+                WHERE f.filename IS NULL
+            """)
+            not_processed = {row[0] for row in cursor.fetchall()}
+            cursor.execute("DELETE FROM tmp_names")
+
+            unprocessed = [f for f in source_files if f in not_processed]
+        else:
+            # Pad the parameter list to a power of two so that only a handful
+            # of distinct statements are prepared and reused from the cache
+            bucket_size = 1 << (len(source_files) - 1).bit_length()
+            placeholders = ','.join('?' * bucket_size)
             cursor.execute(
                 f"SELECT filename FROM processed_files WHERE filename IN ({placeholders})",
-                source_files
+                list(source_files) + [None] * (bucket_size - len(source_files))
             )
             processed = {row['filename'] for row in cursor.fetchall()}
 
             unprocessed = [f for f in source_files if f not in processed]
-            logger.debug(f"Unprocessed files: {len(unprocessed)}/{len(source_files)}")
-            return unprocessed
+        logger.debug(f"Unprocessed files: {len(unprocessed)}/{len(source_files)}")
+        return unprocessed
 
     def get_statistics(self) -> Dict[str, Any]:
         """
         Retrieve database statistics
 
+        The result is cached until the next write through this manager.
+
         Returns:
             Dictionary containing statistics
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-
-            # Total number of processed files
-            cursor.execute("SELECT COUNT(*) as count FROM processed_files")
-            total_files = cursor.fetchone()['count']
-
-            # Total size
-            cursor.execute("SELECT SUM(size) as total_size FROM processed_files")
-            total_size = cursor.fetchone()['total_size'] or 0
-
-            # Number of errors
-            cursor.execute("SELECT COUNT(*) as count FROM errors")
-            total_errors = cursor.fetchone()['count']
-
-            # Last copy
+        if self._stats_cache is None:
+            cursor = self._get_cursor()
             cursor.execute("""
-                SELECT copy_date FROM processed_files
-                ORDER BY copy_date DESC LIMIT 1
+                SELECT total_files, total_size, total_errors,
+                       last_copy AS "last_copy [epoch]"
+                FROM counters
             """)
-            last_copy_row = cursor.fetchone()
-            last_copy = last_copy_row['copy_date'] if last_copy_row else None
+            row = cursor.fetchone()
+            total_files = row['total_files']
+            total_size = row['total_size']
+            total_errors = row['total_errors']
+            last_copy = row['last_copy']
 
-            return {
+            self._stats_cache = {
                 'total_files': total_files,
                 'total_size': total_size,
                 'total_size_gb': round(total_size / (1024**3), 2) if total_size else 0,
@@ -287,6 +578,8 @@ class DatabaseManager:
                 'last_copy': last_copy
             }
 
+        return dict(self._stats_cache)
+
     def check_integrity(self) -> Dict[str, Any]:
         """
         Check database integrity
@@ -294,28 +587,27 @@ class DatabaseManager:
         Returns:
             Integrity report
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-
-            # Check for duplicates
-            cursor.execute("""
-                SELECT filename, COUNT(*) as count
-                FROM processed_files
-                GROUP BY filename
-                HAVING count > 1
-            """)
-            duplicates = cursor.fetchall()
-
-            # Check SQLite integrity
-            cursor.execute("PRAGMA integrity_check")
-            integrity_check = cursor.fetchone()[0]
-
-            return {
-                'status': 'ok' if integrity_check == 'ok' and not duplicates else 'warning',
-                'integrity_check': integrity_check,
-                'duplicates': [dict(row) for row in duplicates] if duplicates else [],
-                'duplicate_count': len(duplicates) if duplicates else 0
-            }
+        cursor = self._get_cursor()
+
+        # Check for duplicates
+        cursor.execute("""
+            SELECT filename, COUNT(*) as count
+            FROM processed_files
+            GROUP BY filename
+            HAVING count > 1
+        """)
+        duplicates = cursor.fetchall()
+
+        # Check SQLite integrity
+        cursor.execute("PRAGMA integrity_check")
+        integrity_check = cursor.fetchone()[0]
+
+        return {
+            'status': 'ok' if integrity_check == 'ok' and not duplicates else 'warning',
+            'integrity_check': integrity_check,
+            'duplicates': [dict(row) for row in duplicates] if duplicates else [],
+            'duplicate_count': len(duplicates) if duplicates else 0
+        }
 
     def begin_transaction(self):
         """Start a transaction"""
@@ -328,8 +620,30 @@ class DatabaseManager:
     def rollback_transaction(self):
         """Rollback the current transaction"""
         self._get_connection().rollback()
+        self._stats_cache = None
         logger.warning("Transaction rolled back")
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Group all writes of a block in a single savepoint
+
+        The savepoint is released when the block exits normally, so the
+        whole block costs a single commit. It is rolled back if the block
+        raises an exception, and the exception is propagated.
+        """
+        connection = self._get_connection()
+        connection.execute("SAVEPOINT batch")
+        try:
+            yield
+        except BaseException:
+            connection.execute("ROLLBACK TO batch")
+            connection.execute("RELEASE batch")
+            self._stats_cache = None
+            logger.warning("Batch rolled back")
+            raise
+        connection.execute("RELEASE batch")
+
     def __enter__(self):
         """Context manager support"""
         return self
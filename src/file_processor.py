@@ -2,12 +2,20 @@
 Main file processing module
 """
 import os
+import re
+import errno
+import mmap
+import threading
+import time
 import shutil
 import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Tuple
-from fnmatch import fnmatch
+from typing import List, Optional, Dict, Any, Tuple, NamedTuple, Iterator
+from fnmatch import translate
+from operator import itemgetter
 import logging
 
 try:
@@ -16,11 +24,84 @@ try:
 except ImportError:
     XXHASH_AVAILABLE = False
 
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
 from .database import DatabaseManager
 from .logger import ProgressLogger
 
 logger = logging.getLogger(__name__)
 
+# Above this number of processed files, the processed names are no longer
+# loaded in memory and lookups are delegated to the database
+PROCESSED_SET_MAX_SIZE = 500_000
+
+# Default hash algorithm (integrity check only, the fastest available)
+DEFAULT_HASH_ALGORITHM = "xxh3" if XXHASH_AVAILABLE else "blake2b"
+
+# Above this size, files are hashed through a memory map
+MMAP_HASH_MIN_SIZE = 2 * 1024 * 1024
+
+# In-kernel copy (Linux), avoids copying data through user space
+COPY_FILE_RANGE_AVAILABLE = hasattr(os, 'copy_file_range')
+
+# Errors meaning copy_file_range cannot be used between these two files
+COPY_FILE_RANGE_UNSUPPORTED = {errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL}
+
+# Target files are created exclusively: the open fails if the file exists
+TARGET_OPEN_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_EXCL
+    | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0)
+)
+
+# Read block size when hashing files (or copying and hashing them at once)
+HASH_BUFFER_SIZE = 1024 * 1024
+
+
+def _compile_patterns(patterns: List[str]) -> Optional[re.Pattern]:
+    """
+    Compile glob patterns into a single regular expression
+
+    Args:
+        patterns: Glob patterns (fnmatch syntax)
+
+    Returns:
+        Regular expression matching any of the patterns, None if there are none
+    """
+    if not patterns:
+        return None
+    # Same case sensitivity as fnmatch (insensitive on Windows)
+    flags = re.IGNORECASE if os.path.normcase('A') == 'a' else 0
+    return re.compile('|'.join(f'(?:{translate(p)})' for p in patterns), flags)
+
+
+# Per-thread read buffer, reused by every copy and hash of a worker thread
+_thread_local = threading.local()
+
+
+def _get_buffer() -> memoryview:
+    """
+    Get the read buffer of the current thread
+
+    Returns:
+        View over a buffer of HASH_BUFFER_SIZE bytes
+    """
+    try:
+        return _thread_local.buffer
+    except AttributeError:
+        _thread_local.buffer = memoryview(bytearray(HASH_BUFFER_SIZE))
+        return _thread_local.buffer
+
+
+class SourceFile(NamedTuple):
+    """File found in the source directory"""
+    path: str
+    name: str
+    size: int
+
 
 class FileProcessor:
     """Main processor for file copying and tracking"""
@@ -32,11 +113,13 @@ class FileProcessor:
         target_dir: str,
         batch_size: int = 10,
         compute_hash: bool = False,
-        hash_algorithm: str = "xxhash",
+        hash_algorithm: str = DEFAULT_HASH_ALGORITHM,
         exclude_patterns: Optional[List[str]] = None,
         include_patterns: Optional[List[str]] = None,
         recursive: bool = True,
-        dry_run: bool = False
+        dry_run: bool = False,
+        verify_hash: bool = False,
+        sort: bool = True
     ):
         """
         Initialize the file processor
@@ -47,22 +130,32 @@ class FileProcessor:
             target_dir: Target directory
             batch_size: Number of files to process per batch
             compute_hash: Enable hash computation
-            hash_algorithm: Hash algorithm (xxhash or sha256)
+            hash_algorithm: Hash algorithm (xxh3, xxhash, blake2b, blake3 or sha256)
             exclude_patterns: File patterns to exclude
             include_patterns: File patterns to include (if specified, only these files are processed)
             recursive: Recursive traversal of subdirectories
             dry_run: Simulation mode
+            verify_hash: Re-read copied files and compare their hash with the
+                source (only with compute_hash)
+            sort: Process files in alphabetical order of their name (otherwise
+                in directory listing order, which saves sorting large sources)
         """
         self.db = db_manager
         self.source_dir = Path(source_dir)
         self.target_dir = Path(target_dir)
+        # Plain string for the per-file path operations
+        self.target_dir_str = str(self.target_dir)
         self.batch_size = batch_size
         self.compute_hash = compute_hash
         self.hash_algorithm = hash_algorithm
         self.exclude_patterns = exclude_patterns or []
         self.include_patterns = include_patterns or []
+        self._exclude_re = _compile_patterns(self.exclude_patterns)
+        self._include_re = _compile_patterns(self.include_patterns)
         self.recursive = recursive
         self.dry_run = dry_run
+        self.verify_hash = verify_hash
+        self.sort = sort
 
         # Validation
         if not self.source_dir.exists():
@@ -72,72 +165,112 @@ class FileProcessor:
         if not self.dry_run:
             self.target_dir.mkdir(parents=True, exist_ok=True)
 
-        # Check xxhash availability
-        if self.compute_hash and self.hash_algorithm == "xxhash" and not XXHASH_AVAILABLE:
-            logger.warning("xxhash not available, using sha256")
-            self.hash_algorithm = "sha256"
+        # Check optional hash libraries availability (integrity check only,
+        # so the fallback is the fastest stdlib hash rather than sha256)
+        if self.compute_hash and self.hash_algorithm in ("xxh3", "xxhash") and not XXHASH_AVAILABLE:
+            logger.warning(f"{self.hash_algorithm} not available, using blake2b")
+            self.hash_algorithm = "blake2b"
+        if self.compute_hash and self.hash_algorithm == "blake3" and not BLAKE3_AVAILABLE:
+            logger.warning("blake3 not available, using blake2b")
+            self.hash_algorithm = "blake2b"
 
         logger.info(f"FileProcessor initialized - Source: {self.source_dir}, Target: {self.target_dir}")
 
-    def get_source_files(self) -> List[Path]:
+    def _walk_source(self) -> Iterator[SourceFile]:
+        """
+        Walk the source directory and yield the files to process
+
+        Directories are read with os.scandir, whose entries cache the file
+        type, so telling files from directories costs no stat call. Each
+        matching file costs a single stat call, and its size is kept for the
+        copy. Files that vanish or become unreadable before their stat are
+        skipped.
+
+        Yields:
+            Source files (path, name and size) matching the include/exclude patterns
+        """
+        directories = [str(self.source_dir)]
+
+        while directories:
+            directory = directories.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        # Symlinked directories are not traversed, symlinked files are copied
+                        if entry.is_dir(follow_symlinks=False):
+                            if self.recursive:
+                                directories.append(entry.path)
+                        elif entry.is_file() and self._should_process(entry.name):
+                            # The file type comes from the directory listing,
+                            # the file may be gone by the time it is stat'ed
+                            try:
+                                size = entry.stat().st_size
+                            except OSError as e:
+                                logger.warning(f"Cannot read file {entry.path}: {str(e)}")
+                                continue
+                            yield SourceFile(entry.path, entry.name, size)
+            except OSError as e:
+                logger.warning(f"Cannot read directory {directory}: {str(e)}")
+
+    def get_source_files(self) -> List[SourceFile]:
         """
         List all files in the source directory
 
         Returns:
-            List of file paths
+            List of source files (path, name and size)
         """
-        files = []
-
-        if self.recursive:
-            # Recursive traversal
-            pattern = "**/*"
-        else:
-            # Non-recursive traversal
-            pattern = "*"
+        files = list(self._walk_source())
 
-        for path in self.source_dir.glob(pattern):
-            if path.is_file() and self._should_process(path):
-                files.append(path)
-
-        # Alphabetical sort
-        files.sort(key=lambda p: p.name)
+        # Alphabetical sort on the name field
+        if self.sort:
+            files.sort(key=itemgetter(1))
 
         logger.debug(f"Files found in source: {len(files)}")
         return files
 
-    def _should_process(self, file_path: Path) -> bool:
+    def _should_process(self, filename: str) -> bool:
         """
         Check if a file should be processed based on include/exclude patterns
 
         Args:
-            file_path: Path of the file to check
+            filename: Name of the file to check
 
         Returns:
             True if the file should be processed
         """
-        filename = file_path.name
-
         # If include patterns are specified, file must match at least one
-        if self.include_patterns:
-            included = False
-            for pattern in self.include_patterns:
-                if fnmatch(filename, pattern):
-                    logger.debug(f"File included by pattern '{pattern}': {filename}")
-                    included = True
-                    break
-            if not included:
-                logger.debug(f"File not matching any include pattern: {filename}")
-                return False
+        if self._include_re is not None and self._include_re.match(filename) is None:
+            logger.debug("File not matching any include pattern: %s", filename)
+            return False
 
         # Check exclusion patterns
-        for pattern in self.exclude_patterns:
-            if fnmatch(filename, pattern):
-                logger.debug(f"File excluded by pattern '{pattern}': {filename}")
-                return False
+        if self._exclude_re is not None and self._exclude_re.match(filename) is not None:
+            logger.debug("File excluded by pattern: %s", filename)
+            return False
 
         return True
 
-    def _compute_file_hash(self, file_path: Path) -> str:
+    def _new_hash(self):
+        """
+        Create a hash object for the configured algorithm
+
+        Returns:
+            Hash object (update/hexdigest interface)
+        """
+        if self.hash_algorithm == "blake3" and BLAKE3_AVAILABLE:
+            # Multithreaded inside the extension for large inputs
+            return blake3.blake3(max_threads=blake3.blake3.AUTO)
+        if self.hash_algorithm == "xxh3" and XXHASH_AVAILABLE:
+            # Vectorized variant, selected at runtime by the extension
+            return xxhash.xxh3_64()
+        if self.hash_algorithm == "xxhash" and XXHASH_AVAILABLE:
+            return xxhash.xxh64()
+        if self.hash_algorithm == "sha256":
+            return hashlib.sha256()
+        # 128-bit digest, enough to detect corruption
+        return hashlib.blake2b(digest_size=16)
+
+    def _compute_file_hash(self, file_path: str) -> str:
         """
         Compute the hash of a file
 
@@ -147,52 +280,156 @@ class FileProcessor:
         Returns:
             Hexadecimal hash of the file
         """
-        if self.hash_algorithm == "xxhash" and XXHASH_AVAILABLE:
-            hash_obj = xxhash.xxh64()
-        else:
-            hash_obj = hashlib.sha256()
+        if self.hash_algorithm == "blake3" and BLAKE3_AVAILABLE:
+            # Memory-mapped inside the extension
+            hash_obj = self._new_hash()
+            hash_obj.update_mmap(file_path)
+            return hash_obj.hexdigest()
+
+        with open(file_path, 'rb', buffering=0) as f:
+            if os.fstat(f.fileno()).st_size > MMAP_HASH_MIN_SIZE:
+                # A single update call over pages read on demand by the kernel
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                        mapped.madvise(mmap.MADV_SEQUENTIAL)
+                    hash_obj = self._new_hash()
+                    hash_obj.update(mapped)
+                    return hash_obj.hexdigest()
+
+            if self.hash_algorithm in ("xxh3", "xxhash") and XXHASH_AVAILABLE:
+                hash_obj = self._new_hash()
+
+                # Read in large blocks into the reused thread buffer (no per-block allocation)
+                view = _get_buffer()
+                while size := f.readinto(view):
+                    hash_obj.update(view[:size])
+
+                return hash_obj.hexdigest()
+
+            return hashlib.file_digest(f, self._new_hash).hexdigest()
+
+    def _copy_file_data(self, source: str, target: str, dst_fd: int, hash_obj=None) -> int:
+        """
+        Copy file data to an open target file
 
-        # Read in blocks for large files
-        with open(file_path, 'rb') as f:
-            while chunk := f.read(8192):
-                hash_obj.update(chunk)
+        When a hash object is given, the source is read a single time: each
+        block is hashed and written to the target. Otherwise, on Linux the data
+        is copied by the kernel (see _copy_file_kernel).
 
-        return hash_obj.hexdigest()
+        Args:
+            source: Source path
+            target: Target path
+            dst_fd: Target file descriptor, open for writing
+            hash_obj: Hash object to update with the copied data (optional)
 
-    def _copy_file(self, source: Path, target: Path) -> Tuple[bool, Optional[str]]:
+        Returns:
+            Source file size when the copy started
+        """
+        if hash_obj is not None:
+            view = _get_buffer()
+            with open(source, 'rb', buffering=0) as fsrc, open(dst_fd, 'wb', closefd=False) as fdst:
+                source_size = os.fstat(fsrc.fileno()).st_size
+                while size := fsrc.readinto(view):
+                    hash_obj.update(view[:size])
+                    fdst.write(view[:size])
+            return source_size
+
+        if COPY_FILE_RANGE_AVAILABLE:
+            with open(source, 'rb') as fsrc:
+                return self._copy_file_kernel(fsrc.fileno(), dst_fd)
+
+        # Platform specific fast copy (e.g. fcopyfile on macOS, CopyFile on Windows)
+        source_size = os.path.getsize(source)
+        shutil.copyfile(source, target)
+        return source_size
+
+    def _copy_file_kernel(self, src_fd: int, dst_fd: int) -> int:
         """
-        Copy a file from source to target
+        Copy file data without going through user space (Linux)
+
+        Uses copy_file_range (which can share extents on filesystems
+        supporting reflinks), falling back to sendfile when both files are
+        not on a compatible filesystem. A source that shrank during the copy
+        is reported by the size check of the caller.
+
+        Args:
+            src_fd: Source file descriptor, open for reading
+            dst_fd: Target file descriptor, open for writing
+
+        Returns:
+            Source file size when the copy started
+        """
+        size = os.fstat(src_fd).st_size
+
+        copied = 0
+        use_sendfile = False
+        try:
+            while copied < size:
+                sent = os.copy_file_range(src_fd, dst_fd, size - copied)
+                if sent == 0:
+                    # Some filesystems report no data instead of an error
+                    use_sendfile = copied == 0
+                    break
+                copied += sent
+        except OSError as e:
+            if e.errno not in COPY_FILE_RANGE_UNSUPPORTED:
+                raise
+            use_sendfile = True
+
+        if use_sendfile:
+            # File offsets were advanced by what was already copied
+            while copied < size:
+                sent = os.sendfile(dst_fd, src_fd, None, size - copied)
+                if sent == 0:
+                    break
+                copied += sent
+
+        return size
+
+    def _copy_file(self, source: str, target: str, hash_obj=None) -> Tuple[bool, Optional[str]]:
+        """
+        Copy a file and its metadata from source to target (as shutil.copy2)
 
         Args:
             source: Source path
             target: Target path
+            hash_obj: Hash object to update with the copied data (optional)
 
         Returns:
             Tuple (success, error message if failed)
         """
         try:
-            # Check if file already exists
-            if target.exists():
+            if self.dry_run:
+                # Check if file already exists
+                if os.path.exists(target):
+                    return False, f"File already exists in target: {target}"
+                logger.info("File copied: %s -> %s", source, target)
+                return True, None
+
+            # Existence check and creation in a single atomic call
+            try:
+                dst_fd = os.open(target, TARGET_OPEN_FLAGS, 0o666)
+            except FileExistsError:
                 return False, f"File already exists in target: {target}"
 
-            if not self.dry_run:
-                # Create parent directory if necessary
-                target.parent.mkdir(parents=True, exist_ok=True)
-
-                # Copy file
-                shutil.copy2(source, target)
+            try:
+                source_size = self._copy_file_data(source, target, dst_fd, hash_obj)
+                target_size = os.fstat(dst_fd).st_size
+            except BaseException:
+                # Do not leave a partial copy behind
+                os.close(dst_fd)
+                os.unlink(target)
+                raise
+            os.close(dst_fd)
 
-                # Verify copy
-                if not target.exists():
-                    return False, "Copy failed (file not created)"
+            # Verify copy
+            if source_size != target_size:
+                os.unlink(target)  # Delete corrupted copy
+                return False, f"Incorrect size after copy ({source_size} != {target_size})"
 
-                source_size = source.stat().st_size
-                target_size = target.stat().st_size
-                if source_size != target_size:
-                    target.unlink()  # Delete corrupted copy
-                    return False, f"Incorrect size after copy ({source_size} != {target_size})"
+            shutil.copystat(source, target)
 
-            logger.info(f"File copied: {source} -> {target}")
+            logger.info("File copied: %s -> %s", source, target)
             return True, None
 
         except PermissionError as e:
@@ -228,13 +465,18 @@ class FileProcessor:
 
         # Filter already processed files
         filenames = [f.name for f in source_files]
-        unprocessed_names = self.db.get_unprocessed_files(filenames)
+        if self.db.count_processed_files() <= PROCESSED_SET_MAX_SIZE:
+            processed_names = self.db.load_processed_filenames()
+            unprocessed_names = {name for name in filenames if name not in processed_names}
+        else:
+            processed_names = set()
+            unprocessed_names = set(self.db.get_unprocessed_files(filenames))
 
         # Select files to process
         files_to_process = []
-        for file_path in source_files:
-            if file_path.name in unprocessed_names:
-                files_to_process.append(file_path)
+        for source_file in source_files:
+            if source_file.name in unprocessed_names:
+                files_to_process.append(source_file)
                 if len(files_to_process) >= self.batch_size:
                     break
 
@@ -247,95 +489,252 @@ class FileProcessor:
         # Progress logger
         progress = ProgressLogger(logger, len(files_to_process), "Processing files")
 
-        # Process each file
-        for file_path in files_to_process:
-            filename = file_path.name
-            target_path = self.target_dir / filename
-            file_size = file_path.stat().st_size
-
-            # Log current file
-            size_mb = file_size / (1024 * 1024)
-            logger.info(f"Processing: {filename} ({size_mb:.2f} MB)")
-
-            # Final check in DB (just in case)
-            if self.db.is_file_processed(filename):
-                logger.debug(f"File already in database (skip): {filename}")
+        # Files sharing a name across subdirectories are only copied once
+        files_to_copy = []
+        for source_file in files_to_process:
+            filename = source_file.name
+            if filename in processed_names:
+                logger.debug("File already processed (skip): %s", filename)
                 stats['skipped'] += 1
                 stats['files_skipped'].append(filename)
-                progress.update(1, f"Skip: {filename}")
+                progress.update(1, "Skip: %s", filename)
                 continue
+            processed_names.add(filename)
+            files_to_copy.append(source_file)
+
+        # Successful copies and copy errors are accumulated, then written
+        # in bulk inside a single transaction
+        copied = []
+        copy_errors = []
+        futures = []
+
+        # Copies run in worker threads (I/O bound, the GIL is released);
+        # results are consumed here so that database writes and statistics
+        # stay on the main thread. The whole batch is written inside a single
+        # savepoint so it costs one commit instead of one per database write
+        try:
+            with (nullcontext() if self.dry_run else self.db.batch()):
+                if files_to_copy:
+                    max_workers = min(len(files_to_copy), (os.cpu_count() or 1) * 4)
+                    executor = ThreadPoolExecutor(max_workers=max_workers)
+                    try:
+                        futures = [
+                            executor.submit(self._process_one, source_file)
+                            for source_file in files_to_copy
+                        ]
+                        for future in as_completed(futures):
+                            result = future.result()
+                            filename = result['filename']
+
+                            if not result['success']:
+                                # Copy error
+                                error_msg = result['error']
+                                logger.error(f"Error copying {filename}: {error_msg}")
+
+                                if not self.dry_run:
+                                    copy_errors.append((filename, "COPY_ERROR", error_msg))
+
+                                stats['errors'] += 1
+                                stats['files_errors'].append({'file': filename, 'error': error_msg})
+                                progress.update(1, "Error: %s", filename)
+                                continue
+
+                            if self.dry_run:
+                                stats['processed'] += 1
+                                stats['total_size'] += result['size']
+                                stats['files_processed'].append(filename)
+                                progress.update(1, "OK: %s", filename)
+                                continue
+
+                            # Queue for registration, written to the database once per batch
+                            copied.append((
+                                filename, result['source_path'], result['target_path'],
+                                result['size'], result['copy_date'], result['hash']
+                            ))
+                            progress.update(1, "Copied: %s", filename)
+                    finally:
+                        # On interruption, copies not started yet are cancelled
+                        # instead of being waited for
+                        executor.shutdown(cancel_futures=True)
+
+                # Register in database
+                if not self.dry_run:
+                    self.db.log_errors(copy_errors)
+                    self._register_copied_files(copied, stats)
+        except BaseException:
+            # The batch was rolled back: copies left without a database record
+            # would be reported as already existing by every later batch
+            # (including copies completed but not consumed yet)
+            if not self.dry_run:
+                self._delete_copies([
+                    future.result()['target_path'] for future in futures
+                    if future.done() and not future.cancelled()
+                    and future.exception() is None and future.result()['success']
+                ])
+            raise
+
+        # End processing
+        progress.complete()
+
+        # Calculate duration
+        duration = (datetime.now() - start_time).total_seconds()
+        stats['duration'] = duration
 
-            # Copy file
-            success, error_msg = self._copy_file(file_path, target_path)
+        # Summary
+        total_size_mb = stats['total_size'] / (1024 * 1024)
+        logger.info(
+            f"Batch complete: {stats['processed']} processed, "
+            f"{stats['skipped']} skipped, {stats['errors']} errors "
+            f"({total_size_mb:.2f} MB in {duration:.2f}s)"
+        )
 
-            if not success:
-                # Copy error
-                logger.error(f"Error copying {filename}: {error_msg}")
+        return stats
 
-                if not self.dry_run:
-                    self.db.log_error(filename, "COPY_ERROR", error_msg)
+    def _process_one(self, source_file: SourceFile) -> Dict[str, Any]:
+        """
+        Copy a single file and compute its hash if requested
 
-                stats['errors'] += 1
-                stats['files_errors'].append({'file': filename, 'error': error_msg})
-                progress.update(1, f"Error: {filename}")
-                continue
+        Performs no database write, so it can run in a worker thread.
 
-            # Compute hash if requested
-            file_hash = None
-            if self.compute_hash and not self.dry_run:
-                logger.debug(f"Computing hash for {filename}")
-                try:
-                    file_hash = self._compute_file_hash(target_path)
-                except Exception as e:
-                    logger.warning(f"Error computing hash: {str(e)}")
+        Args:
+            source_file: Source file
 
-            # Register in database
-            if not self.dry_run:
+        Returns:
+            Result with filename, source_path, target_path, size, success,
+            error (message if failed), copy_date and hash
+        """
+        filename = source_file.name
+        target_path = os.path.join(self.target_dir_str, filename)
+        file_size = source_file.size
+
+        # Log current file
+        logger.info("Processing: %s (%.2f MB)", filename, file_size / (1024 * 1024))
+
+        # Never raises, so that a single file cannot abort the whole batch
+        try:
+            # Copy file, hashing the data on the way if requested
+            hash_obj = self._new_hash() if self.compute_hash and not self.dry_run else None
+            success, error_msg = self._copy_file(source_file.path, target_path, hash_obj)
+            file_hash = hash_obj.hexdigest() if success and hash_obj is not None else None
+
+            # The hash is computed from the source data; optionally check the copy too
+            if file_hash is not None and self.verify_hash:
+                error_msg = self._verify_copy(target_path, file_hash)
+                if error_msg:
+                    success, file_hash = False, None
+        except Exception as e:
+            success, error_msg, file_hash = False, f"Unexpected error: {str(e)}", None
+
+        return {
+            'filename': filename,
+            'source_path': source_file.path,
+            'target_path': target_path,
+            'size': file_size,
+            'success': success,
+            'error': error_msg,
+            # Stored as Unix epoch seconds, cheaper than building a datetime
+            'copy_date': int(time.time()),
+            'hash': file_hash
+        }
+
+    def _verify_copy(self, target_path: str, file_hash: str) -> Optional[str]:
+        """
+        Compare the hash of a copy with the hash of its source
+
+        A copy that does not match is deleted.
+
+        Args:
+            target_path: Path of the copy in target
+            file_hash: Hash computed from the source data
+
+        Returns:
+            Error message if the copy does not match, None otherwise
+        """
+        logger.debug("Verifying hash of %s", target_path)
+        try:
+            target_hash = self._compute_file_hash(target_path)
+        except Exception as e:
+            target_hash = None
+            logger.warning(f"Error computing hash: {str(e)}")
+
+        if target_hash == file_hash:
+            return None
+
+        # Delete corrupted copy
+        try:
+            os.unlink(target_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Error deleting {target_path}: {str(e)}")
+        return f"Hash mismatch after copy ({file_hash} != {target_hash})"
+
+    def _delete_copies(self, target_paths: List[str]):
+        """
+        Delete copies whose database registration was rolled back
+
+        Args:
+            target_paths: Paths of the copies in target
+        """
+        for target_path in target_paths:
+            try:
+                os.unlink(target_path)
+                logger.warning(f"File deleted due to batch rollback: {target_path}")
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.error(f"Error deleting {target_path}: {str(e)}")
+
+    def _register_copied_files(
+        self,
+        rows: List[Tuple[str, str, str, int, int, Optional[str]]],
+        stats: Dict[str, Any]
+    ):
+        """
+        Register copied files in the database and update batch statistics
+
+        All rows are inserted with a single statement. If that fails, files
+        are registered one by one so that only the faulty ones are rejected.
+
+        Args:
+            rows: Tuples of (filename, source_path, target_path, size,
+                copy_date, file_hash)
+            stats: Batch statistics to update
+        """
+        try:
+            self.db.add_processed_files(rows)
+            registered = rows
+        except Exception as bulk_error:
+            logger.warning(f"Bulk registration failed, retrying file by file: {str(bulk_error)}")
+            registered = []
+            for row in rows:
+                filename, source_path, target_path, file_size, copy_date, file_hash = row
                 try:
                     self.db.add_processed_file(
                         filename=filename,
-                        source_path=str(file_path),
-                        target_path=str(target_path),
+                        source_path=source_path,
+                        target_path=target_path,
                         size=file_size,
-                        copy_date=datetime.now(),
+                        copy_date=copy_date,
                         file_hash=file_hash
                     )
-                    logger.info(f"File registered in database: {filename}")
+                    registered.append(row)
                 except Exception as e:
                     # DB error - delete copied file
                     logger.error(f"Database error for {filename}: {str(e)}")
-                    if target_path.exists():
-                        target_path.unlink()
+                    if os.path.exists(target_path):
+                        os.unlink(target_path)
                         logger.warning(f"File deleted due to database error: {target_path}")
 
                     self.db.log_error(filename, "DB_ERROR", str(e))
                     stats['errors'] += 1
                     stats['files_errors'].append({'file': filename, 'error': str(e)})
-                    progress.update(1, f"DB Error: {filename}")
-                    continue
 
-            # Success
+        # Success
+        for filename, _, _, file_size, _, _ in registered:
             stats['processed'] += 1
             stats['total_size'] += file_size
             stats['files_processed'].append(filename)
-            progress.update(1, f"OK: {filename}")
-
-        # End processing
-        progress.complete()
-
-        # Calculate duration
-        duration = (datetime.now() - start_time).total_seconds()
-        stats['duration'] = duration
-
-        # Summary
-        total_size_mb = stats['total_size'] / (1024 * 1024)
-        logger.info(
-            f"Batch complete: {stats['processed']} processed, "
-            f"{stats['skipped']} skipped, {stats['errors']} errors "
-            f"({total_size_mb:.2f} MB in {duration:.2f}s)"
-        )
-
-        return stats
 
     def verify_target_files(self) -> List[str]:
         """
@@ -347,7 +746,8 @@ class FileProcessor:
         if not self.target_dir.exists():
             return []
 
-        target_files = [f.name for f in self.target_dir.iterdir() if f.is_file()]
+        with os.scandir(self.target_dir_str) as entries:
+            target_files = [entry.name for entry in entries if entry.is_file()]
         logger.info(f"Files in target: {len(target_files)}")
         return target_files
 
@@ -362,14 +762,8 @@ class FileProcessor:
         if not target_files:
             return 0
 
-        # Check which files are in database
-        processed = []
-        for filename in target_files:
-            if self.db.is_file_processed(filename):
-                processed.append(filename)
-
         # Identify orphans
-        orphans = set(target_files) - set(processed)
+        orphans = set(target_files) - self.db.load_processed_filenames()
 
         if not orphans:
             logger.info("No orphan files in target")
@@ -378,16 +772,15 @@ class FileProcessor:
         # Delete orphans
         deleted = 0
         for filename in orphans:
-            file_path = self.target_dir / filename
             if not self.dry_run:
                 try:
-                    file_path.unlink()
-                    logger.info(f"Orphan file deleted: {filename}")
+                    os.unlink(os.path.join(self.target_dir_str, filename))
+                    logger.info("Orphan file deleted: %s", filename)
                     deleted += 1
                 except Exception as e:
                     logger.error(f"Error deleting {filename}: {str(e)}")
             else:
-                logger.info(f"[DRY-RUN] Orphan file to delete: {filename}")
+                logger.info("[DRY-RUN] Orphan file to delete: %s", filename)
                 deleted += 1
 
         return deleted
\ No newline at end of file
@@ -95,6 +95,23 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
+def get_null_logger() -> logging.Logger:
+    """
+    Get a logger that discards every message
+
+    Used instead of setup_logging when no log output is wanted (e.g. JSON
+    output mode), so that no handler or log file is opened.
+
+    Returns:
+        Logger without output
+    """
+    null_logger = logging.getLogger('file_process_tracker.null')
+    if not null_logger.handlers:
+        null_logger.addHandler(logging.NullHandler())
+        null_logger.propagate = False
+    return null_logger
+
+
 class LogContext:
     """Context manager for temporary logs with different level"""
 
@@ -161,25 +178,39 @@ class ProgressLogger:
         self.prefix = prefix
         self.current = 0
         self.last_percentage = -1
+        # Number of processed elements from which the next message is logged
+        self._next_threshold = 0
 
-    def update(self, increment: int = 1, message: Optional[str] = None):
+    def update(self, increment: int = 1, message: Optional[str] = None, *args):
         """
         Update the progress
 
         Args:
             increment: Number of processed elements
-            message: Optional message to display
+            message: Optional message to display, %-formatted with args
+                only when a progress message is logged (as in logging calls)
+            *args: Arguments merged into the message
         """
         self.current += increment
-        percentage = int((self.current / self.total) * 100) if self.total > 0 else 100
 
         # Log only if percentage decade changes
-        if percentage // 10 > self.last_percentage // 10:
+        if self.current < self._next_threshold:
+            return
+
+        percentage = self.current * 100 // self.total if self.total > 0 else 100
+        decade = percentage // 10
+        self.last_percentage = percentage
+        if self.total > 0:
+            # First element count reaching the next decade
+            self._next_threshold = -(-(decade + 1) * self.total // 10)
+        else:
+            self._next_threshold = float('inf')
+
+        if self.logger.isEnabledFor(logging.INFO):
             progress_msg = f"{self.prefix}: {self.current}/{self.total} ({percentage}%)"
             if message:
-                progress_msg += f" - {message}"
+                progress_msg += f" - {message % args if args else message}"
             self.logger.info(progress_msg)
-            self.last_percentage = percentage
 
     def complete(self, message: Optional[str] = None):
         """
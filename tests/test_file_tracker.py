@@ -2,15 +2,24 @@
 Simple pytest tests for File Process Tracker
 """
 import pytest
+import os
+import errno
+import hashlib
 import tempfile
 import shutil
 from pathlib import Path
 import sqlite3
+import json
+import logging
 from datetime import datetime
 
+from click.testing import CliRunner
+
 from src.database import DatabaseManager
 from src.config_loader import Config
-from src.file_processor import FileProcessor
+from src.file_processor import FileProcessor, XXHASH_AVAILABLE
+from src.logger import ProgressLogger
+from main import main
 
 
 @pytest.fixture
@@ -63,6 +72,39 @@ def sample_files(temp_dirs):
     return created_files
 
 
+@pytest.fixture
+def cli_config(tmp_path, temp_dirs, sample_files, monkeypatch):
+    """Configuration file and environment for command line tests"""
+    source_dir, target_dir = temp_dirs
+    monkeypatch.setenv("SOURCE_DIR", source_dir)
+    monkeypatch.setenv("TARGET_DIR", target_dir)
+    for env_var in Config._ENV_MAPPINGS.keys() - {"SOURCE_DIR", "TARGET_DIR"}:
+        monkeypatch.delenv(env_var, raising=False)
+
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(f"""
+database:
+  path: "{tmp_path / 'tracker.db'}"
+processing:
+  batch_size: 10
+exclude_patterns:
+  - "*.tmp"
+  - ".*"
+logging:
+  file: "{tmp_path / 'logs' / 'tracker.log'}"
+""")
+
+    # The commands replace the root logger handlers, restore them afterwards
+    root_logger = logging.getLogger()
+    handlers, level = root_logger.handlers[:], root_logger.level
+    yield str(config_file)
+    for handler in root_logger.handlers:
+        if handler not in handlers:
+            handler.close()
+    root_logger.handlers[:] = handlers
+    root_logger.setLevel(level)
+
+
 class TestDatabaseManager:
     """Test database operations"""
 
@@ -81,6 +123,94 @@ class TestDatabaseManager:
 
         db.close()
 
+    def test_connection_uses_wal(self, temp_db):
+        """Test that the persistent connection is opened in WAL mode"""
+        db = DatabaseManager(temp_db)
+
+        journal_mode = db.connection.execute("PRAGMA journal_mode").fetchone()[0]
+        assert journal_mode == "wal"
+
+        db.close()
+
+    def test_open_existing_database_without_writing(self, temp_db):
+        """Test that opening an up-to-date database neither writes nor waits for a writer"""
+        DatabaseManager(temp_db).close()
+
+        observer = sqlite3.connect(temp_db)
+        data_version = observer.execute("PRAGMA data_version").fetchone()[0]
+        DatabaseManager(temp_db).close()
+        assert observer.execute("PRAGMA data_version").fetchone()[0] == data_version
+
+        # Another process holding the write lock does not block readers
+        writer = sqlite3.connect(temp_db, isolation_level=None)
+        writer.execute("BEGIN IMMEDIATE")
+        try:
+            db = DatabaseManager(temp_db)
+            assert db.get_statistics()['total_files'] == 0
+            db.close()
+        finally:
+            writer.execute("ROLLBACK")
+            writer.close()
+            observer.close()
+
+    def test_reopen_after_close(self, temp_db):
+        """Test that the connection is reopened transparently after close()"""
+        db = DatabaseManager(temp_db)
+        db.close()
+
+        with db.batch():
+            db.add_processed_file(
+                filename="reopened.txt",
+                source_path="/source/reopened.txt",
+                target_path="/target/reopened.txt",
+                size=100,
+                copy_date=datetime.now()
+            )
+        db.close()
+
+        assert db.is_file_processed("reopened.txt")
+        db.close()
+        assert list(db.iter_filenames()) == ["reopened.txt"]
+
+        db.close()
+
+    def test_transaction_rollback(self, temp_db):
+        """Test that writes inside a rolled back transaction are discarded"""
+        db = DatabaseManager(temp_db)
+
+        db.begin_transaction()
+        db.add_processed_file(
+            filename="rolled_back.txt",
+            source_path="/source/rolled_back.txt",
+            target_path="/target/rolled_back.txt",
+            size=100,
+            copy_date=datetime.now()
+        )
+        db.rollback_transaction()
+
+        assert not db.is_file_processed("rolled_back.txt")
+
+        db.close()
+
+    def test_batch_savepoint(self, temp_db):
+        """Test that a failing batch discards its writes and a successful one keeps them"""
+        db = DatabaseManager(temp_db)
+
+        with pytest.raises(RuntimeError):
+            with db.batch():
+                db.log_error("failed.txt", "COPY_ERROR", "Test error")
+                raise RuntimeError("Test failure")
+
+        assert db.get_statistics()['total_errors'] == 0
+
+        with db.batch():
+            db.log_error("failed.txt", "COPY_ERROR", "Test error")
+
+        assert db.get_statistics()['total_errors'] == 1
+        assert not db.connection.in_transaction
+
+        db.close()
+
     def test_add_processed_file(self, temp_db):
         """Test adding a processed file to database"""
         db = DatabaseManager(temp_db)
@@ -101,6 +231,25 @@ class TestDatabaseManager:
 
         db.close()
 
+    def test_add_processed_files_bulk(self, temp_db):
+        """Test bulk insertion is all-or-nothing"""
+        db = DatabaseManager(temp_db)
+
+        rows = [
+            (f"bulk{i}.txt", f"/source/bulk{i}.txt", f"/target/bulk{i}.txt", 100, datetime.now(), None)
+            for i in range(3)
+        ]
+        assert db.add_processed_files(rows) == 3
+        assert db.is_file_processed("bulk2.txt")
+
+        # A duplicate anywhere in the batch rejects the whole batch
+        new_row = ("new.txt", "/source/new.txt", "/target/new.txt", 100, datetime.now(), None)
+        with pytest.raises(sqlite3.IntegrityError):
+            db.add_processed_files([new_row, rows[0]])
+        assert not db.is_file_processed("new.txt")
+
+        db.close()
+
     def test_get_unprocessed_files(self, temp_db):
         """Test filtering unprocessed files"""
         db = DatabaseManager(temp_db)
@@ -125,6 +274,52 @@ class TestDatabaseManager:
 
         db.close()
 
+    def test_get_unprocessed_files_large_list(self, temp_db):
+        """Test filtering a list larger than the IN clause limit"""
+        db = DatabaseManager(temp_db)
+
+        db.add_processed_file(
+            filename="file0.txt",
+            source_path="/source/file0.txt",
+            target_path="/target/file0.txt",
+            size=100,
+            copy_date=datetime.now()
+        )
+
+        all_files = [f"file{i}.txt" for i in range(2000)]
+        unprocessed = db.get_unprocessed_files(all_files)
+
+        assert len(unprocessed) == 1999
+        assert "file0.txt" not in unprocessed
+        assert unprocessed == all_files[1:]  # Order is preserved
+
+        db.close()
+
+    def test_get_processed_files_pagination(self, temp_db):
+        """Test limit and offset when listing processed files"""
+        db = DatabaseManager(temp_db)
+
+        for i in range(5):
+            db.add_processed_file(
+                filename=f"file{i}.txt",
+                source_path=f"/source/file{i}.txt",
+                target_path=f"/target/file{i}.txt",
+                size=100,
+                copy_date=datetime(2024, 1, i + 1)
+            )
+
+        # Most recent first
+        page = db.get_processed_files(limit=2, offset=1)
+        assert [f['filename'] for f in page] == ["file3.txt", "file2.txt"]
+        assert page[0]['copy_date'] == datetime(2024, 1, 4)
+        assert len(db.get_processed_files()) == 5
+
+        # Display-only listing gets dates formatted by SQLite
+        rows = list(db.iter_processed_files(limit=1, date_as_text=True))
+        assert rows[0]['copy_date'] == "2024-01-05 00:00:00"
+
+        db.close()
+
     def test_log_error(self, temp_db):
         """Test error logging"""
         db = DatabaseManager(temp_db)
@@ -175,6 +370,82 @@ class TestFileProcessor:
 
         db.close()
 
+    def test_get_source_files_with_inclusions(self, temp_dirs, sample_files, temp_db):
+        """Test that only files matching an include pattern and no exclude pattern are listed"""
+        source_dir, target_dir = temp_dirs
+        db = DatabaseManager(temp_db)
+
+        processor = FileProcessor(
+            db_manager=db,
+            source_dir=source_dir,
+            target_dir=target_dir,
+            include_patterns=["*.txt", "*.jpg"],
+            exclude_patterns=[".*"],
+            recursive=False,
+            dry_run=True
+        )
+
+        filenames = [f.name for f in processor.get_source_files()]
+        assert filenames == ["file1.txt", "file2.jpg"]
+
+        db.close()
+
+    def test_get_source_files_unsorted(self, temp_dirs, sample_files, temp_db):
+        """Test that listing in directory order still lists every file"""
+        source_dir, target_dir = temp_dirs
+        (Path(source_dir) / "sub").mkdir()
+        (Path(source_dir) / "sub" / "file0.png").write_text("Nested image")
+        db = DatabaseManager(temp_db)
+
+        processor = FileProcessor(
+            db_manager=db,
+            source_dir=source_dir,
+            target_dir=target_dir,
+            exclude_patterns=["*.tmp", ".*"],
+            sort=False,
+            dry_run=True
+        )
+
+        filenames = [f.name for f in processor.get_source_files()]
+        assert sorted(filenames) == ["file0.png", "file1.txt", "file2.jpg", "file3.mp4"]
+
+        # The default order is alphabetical on the name
+        processor.sort = True
+        filenames = [f.name for f in processor.get_source_files()]
+        assert filenames == ["file0.png", "file1.txt", "file2.jpg", "file3.mp4"]
+
+        db.close()
+
+    def test_file_vanishing_during_listing(self, temp_dirs, sample_files, temp_db, monkeypatch):
+        """Test that a file deleted between the directory listing and its stat is skipped"""
+        source_dir, target_dir = temp_dirs
+        db = DatabaseManager(temp_db)
+
+        processor = FileProcessor(
+            db_manager=db,
+            source_dir=source_dir,
+            target_dir=target_dir,
+            exclude_patterns=["*.tmp", ".*"],
+            dry_run=False
+        )
+
+        # Checked after the listing and before the stat of each entry
+        should_process = processor._should_process
+
+        def vanishing(filename):
+            if filename == "file2.jpg":
+                os.unlink(os.path.join(source_dir, filename))
+            return should_process(filename)
+        monkeypatch.setattr(processor, "_should_process", vanishing)
+
+        stats = processor.process_batch()
+
+        assert stats['processed'] == 2
+        assert stats['errors'] == 0
+        assert sorted(os.listdir(target_dir)) == ["file1.txt", "file3.mp4"]
+
+        db.close()
+
     def test_process_batch_dry_run(self, temp_dirs, sample_files, temp_db):
         """Test batch processing in dry-run mode"""
         source_dir, target_dir = temp_dirs
@@ -242,6 +513,125 @@ class TestFileProcessor:
 
         db.close()
 
+    def test_compute_file_hash(self, temp_dirs, temp_db):
+        """Test that file hashes match the reference digests, read or memory-mapped"""
+        source_dir, target_dir = temp_dirs
+        db = DatabaseManager(temp_db)
+        processor = FileProcessor(db_manager=db, source_dir=source_dir, target_dir=target_dir)
+
+        # Below and above the memory map threshold
+        for size in (1024 * 1024 + 123, 3 * 1024 * 1024 + 123):
+            content = os.urandom(size)
+            file_path = Path(source_dir) / "data.bin"
+            file_path.write_bytes(content)
+
+            processor.hash_algorithm = "sha256"
+            assert processor._compute_file_hash(file_path) == hashlib.sha256(content).hexdigest()
+
+            processor.hash_algorithm = "blake2b"
+            assert processor._compute_file_hash(file_path) == hashlib.blake2b(
+                content, digest_size=16
+            ).hexdigest()
+
+            if XXHASH_AVAILABLE:
+                import xxhash
+                processor.hash_algorithm = "xxhash"
+                assert processor._compute_file_hash(file_path) == xxhash.xxh64(content).hexdigest()
+                processor.hash_algorithm = "xxh3"
+                assert processor._compute_file_hash(file_path) == xxhash.xxh3_64(content).hexdigest()
+
+        db.close()
+
+    def test_process_batch_records_hash(self, temp_dirs, sample_files, temp_db):
+        """Test that the hash computed during the copy is recorded"""
+        source_dir, target_dir = temp_dirs
+        db = DatabaseManager(temp_db)
+
+        processor = FileProcessor(
+            db_manager=db,
+            source_dir=source_dir,
+            target_dir=target_dir,
+            compute_hash=True,
+            hash_algorithm="sha256",
+            include_patterns=["file1.txt"]
+        )
+        stats = processor.process_batch()
+        assert stats['processed'] == 1
+
+        recorded = db.connection.execute(
+            "SELECT hash FROM processed_files WHERE filename = 'file1.txt'"
+        ).fetchone()[0]
+        assert recorded == hashlib.sha256(b"Content of file 1").hexdigest()
+        assert (Path(target_dir) / "file1.txt").read_text() == "Content of file 1"
+
+        db.close()
+
+    def test_verify_hash_rejects_corrupted_copy(self, temp_dirs, sample_files, temp_db, monkeypatch):
+        """Test that a copy whose hash differs from the source is deleted and reported"""
+        source_dir, target_dir = temp_dirs
+        db = DatabaseManager(temp_db)
+
+        processor = FileProcessor(
+            db_manager=db,
+            source_dir=source_dir,
+            target_dir=target_dir,
+            compute_hash=True,
+            verify_hash=True,
+            include_patterns=["file1.txt"]
+        )
+        monkeypatch.setattr(processor, "_compute_file_hash", lambda path: "corrupted")
+
+        stats = processor.process_batch()
+
+        assert stats['processed'] == 0
+        assert stats['errors'] == 1
+        assert "Hash mismatch" in stats['files_errors'][0]['error']
+        assert not (Path(target_dir) / "file1.txt").exists()
+        assert not db.is_file_processed("file1.txt")
+
+        db.close()
+
+    def test_copy_file_preserves_content(self, temp_dirs, temp_db, monkeypatch):
+        """Test that copies keep content and modification time, with and without copy_file_range"""
+        source_dir, target_dir = temp_dirs
+        content = os.urandom(2 * 1024 * 1024 + 7)
+        source = Path(source_dir) / "video.mp4"
+        source.write_bytes(content)
+        os.utime(source, (1_700_000_000, 1_700_000_000))
+
+        db = DatabaseManager(temp_db)
+        processor = FileProcessor(db_manager=db, source_dir=source_dir, target_dir=target_dir)
+
+        target = Path(target_dir) / "video.mp4"
+        assert processor._copy_file(str(source), target) == (True, None)
+        assert target.read_bytes() == content
+        assert target.stat().st_mtime == source.stat().st_mtime
+
+        # An existing target is never overwritten
+        success, error_msg = processor._copy_file(str(source), target)
+        assert not success
+        assert "already exists" in error_msg
+        assert target.read_bytes() == content
+
+        # Filesystems without copy_file_range support fall back to sendfile
+        if hasattr(os, "copy_file_range"):
+            def unsupported(*args):
+                raise OSError(errno.EXDEV, "Cross-device link")
+            monkeypatch.setattr(os, "copy_file_range", unsupported)
+
+            fallback_target = Path(target_dir) / "fallback.mp4"
+            assert processor._copy_file(str(source), fallback_target) == (True, None)
+            assert fallback_target.read_bytes() == content
+
+            # Some filesystems report no data instead of an error
+            monkeypatch.setattr(os, "copy_file_range", lambda *args: 0)
+
+            empty_range_target = Path(target_dir) / "empty_range.mp4"
+            assert processor._copy_file(str(source), empty_range_target) == (True, None)
+            assert empty_range_target.read_bytes() == content
+
+        db.close()
+
     def test_duplicate_prevention(self, temp_dirs, sample_files, temp_db):
         """Test that already processed files are not reprocessed"""
         source_dir, target_dir = temp_dirs
@@ -273,6 +663,98 @@ class TestFileProcessor:
 
         db.close()
 
+    def test_rollback_deletes_batch_copies(self, temp_dirs, sample_files, temp_db, monkeypatch):
+        """Test that an interrupted batch leaves no unregistered copy in target"""
+        source_dir, target_dir = temp_dirs
+        db = DatabaseManager(temp_db)
+
+        processor = FileProcessor(
+            db_manager=db,
+            source_dir=source_dir,
+            target_dir=target_dir,
+            batch_size=10,
+            exclude_patterns=["*.tmp", ".*"],
+            dry_run=False
+        )
+
+        def interrupted(rows):
+            raise KeyboardInterrupt
+        monkeypatch.setattr(db, "add_processed_files", interrupted)
+
+        with pytest.raises(KeyboardInterrupt):
+            processor.process_batch()
+
+        assert list(Path(target_dir).iterdir()) == []
+        assert db.count_processed_files() == 0
+
+        # The next batch copies the same files again without errors
+        monkeypatch.undo()
+        stats = processor.process_batch()
+        assert stats['processed'] == 3
+        assert stats['errors'] == 0
+
+        db.close()
+
+    def test_unexpected_error_does_not_abort_batch(self, temp_dirs, sample_files, temp_db, monkeypatch):
+        """Test that an unexpected error on one file is reported as a copy error"""
+        source_dir, target_dir = temp_dirs
+        db = DatabaseManager(temp_db)
+
+        processor = FileProcessor(
+            db_manager=db,
+            source_dir=source_dir,
+            target_dir=target_dir,
+            batch_size=10,
+            exclude_patterns=["*.tmp", ".*"],
+            compute_hash=True,
+            verify_hash=True,
+            dry_run=False
+        )
+
+        compute_file_hash = processor._compute_file_hash
+
+        def failing_hash(file_path):
+            if file_path.endswith("file2.jpg"):
+                raise RuntimeError("hash failure")
+            return compute_file_hash(file_path)
+        monkeypatch.setattr(processor, "_compute_file_hash", failing_hash)
+
+        stats = processor.process_batch()
+
+        assert stats['processed'] == 2
+        assert stats['errors'] == 1
+        assert stats['files_errors'][0]['file'] == "file2.jpg"
+        # The unverified copy was deleted
+        assert not (Path(target_dir) / "file2.jpg").exists()
+        assert db.count_processed_files() == 2
+
+        db.close()
+
+    def test_same_name_in_subdirectories(self, temp_dirs, temp_db):
+        """Test that files sharing a name across subdirectories are copied once"""
+        source_dir, target_dir = temp_dirs
+        for subdir in ("2023", "2024"):
+            (Path(source_dir) / subdir).mkdir()
+            (Path(source_dir) / subdir / "photo.jpg").write_text(subdir)
+
+        db = DatabaseManager(temp_db)
+        processor = FileProcessor(
+            db_manager=db,
+            source_dir=source_dir,
+            target_dir=target_dir,
+            batch_size=10,
+            dry_run=False
+        )
+
+        stats = processor.process_batch()
+
+        assert stats['processed'] == 1
+        assert stats['skipped'] == 1
+        assert stats['errors'] == 0
+        assert db.is_file_processed("photo.jpg")
+
+        db.close()
+
     def test_clean_orphans(self, temp_dirs, temp_db):
         """Test cleaning orphan files from target"""
         source_dir, target_dir = temp_dirs
@@ -351,6 +833,70 @@ processing:
         assert config.compute_hash is False  # Default
         assert config.dry_run is False  # Default
 
+    def test_sort_files_from_environment(self, tmp_path, monkeypatch):
+        """Test that SORT_FILES overrides processing.sort"""
+        monkeypatch.setenv("SOURCE_DIR", str(tmp_path))
+        monkeypatch.setenv("TARGET_DIR", str(tmp_path / "target"))
+
+        config_file = tmp_path / "test_config.yaml"
+        config_file.write_text("""
+database:
+  path: test.db
+processing:
+  batch_size: 5
+""")
+
+        assert Config(str(config_file)).sort_files is True  # Default
+
+        monkeypatch.setenv("SORT_FILES", "false")
+        assert Config(str(config_file)).sort_files is False
+
+    def test_cli_overrides_after_access(self, tmp_path, monkeypatch):
+        """Test that CLI overrides are visible after properties were read"""
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        monkeypatch.setenv("SOURCE_DIR", str(source_dir))
+        monkeypatch.setenv("TARGET_DIR", str(tmp_path / "target"))
+
+        config_file = tmp_path / "test_config.yaml"
+        config_file.write_text("""
+database:
+  path: test.db
+processing:
+  batch_size: 5
+""")
+
+        config = Config(str(config_file))
+        assert config.batch_size == 5
+
+        config.apply_cli_overrides(batch_size=50, exclude=("*.log",))
+        assert config.batch_size == 50
+        assert config.exclude_patterns == ["*.log"]
+
+
+class TestProgressLogger:
+    """Test progress messages"""
+
+    @pytest.mark.parametrize("total, expected_counts", [
+        (1, [1]),
+        (7, [1, 2, 3, 4, 5, 6, 7]),
+        (29, [1, 3, 6, 9, 12, 15, 18, 21, 24, 27, 29]),
+        (100, [1, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100]),
+    ])
+    def test_messages_at_each_decade(self, caplog, total, expected_counts):
+        """Test that a message is logged for the first element of each percentage decade"""
+        test_logger = logging.getLogger("test_progress")
+        progress = ProgressLogger(test_logger, total, "Copy")
+
+        with caplog.at_level(logging.INFO, logger="test_progress"):
+            for index in range(1, total + 1):
+                progress.update(1, "Copied: %s", f"file{index}")
+
+        assert [record.getMessage() for record in caplog.records] == [
+            f"Copy: {count}/{total} ({count * 100 // total}%) - Copied: file{count}"
+            for count in expected_counts
+        ]
+
 
 class TestStatistics:
     """Test statistics and reporting"""
@@ -381,6 +927,94 @@ class TestStatistics:
 
         db.close()
 
+    def test_statistics_cache_invalidation(self, temp_db):
+        """Test that cached statistics are refreshed after a write"""
+        db = DatabaseManager(temp_db)
+
+        assert db.get_statistics()['total_files'] == 0
+
+        db.add_processed_file(
+            filename="new.txt",
+            source_path="/source/new.txt",
+            target_path="/target/new.txt",
+            size=2048,
+            copy_date=datetime.now()
+        )
+        db.log_error("error_file.txt", "COPY_ERROR", "Test error")
+
+        stats = db.get_statistics()
+        assert stats['total_files'] == 1
+        assert stats['total_size'] == 2048
+        assert stats['total_errors'] == 1
+
+        db.close()
+
+    def test_existing_database_upgrade(self, temp_db):
+        """Test that a database written by earlier versions is migrated and counted"""
+        with sqlite3.connect(temp_db) as conn:
+            conn.execute("""
+                CREATE TABLE processed_files (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    filename TEXT UNIQUE NOT NULL,
+                    source_path TEXT NOT NULL,
+                    target_path TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    copy_date DATETIME NOT NULL,
+                    hash TEXT,
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            conn.executemany(
+                "INSERT INTO processed_files (filename, source_path, target_path, size, copy_date) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    ("old1.txt", "/s/old1.txt", "/t/old1.txt", 100, "2024-01-01T10:00:00"),
+                    ("old2.txt", "/s/old2.txt", "/t/old2.txt", 200, "2024-02-01T10:00:00"),
+                ]
+            )
+        conn.close()
+
+        db = DatabaseManager(temp_db)
+        stats = db.get_statistics()
+        assert stats['total_files'] == 2
+        assert stats['total_size'] == 300
+        assert stats['total_errors'] == 0
+        assert stats['last_copy'] == datetime(2024, 2, 1, 10, 0, 0)
+
+        # ISO 8601 dates are migrated to Unix epoch integers
+        types = {row[0] for row in db.connection.execute("SELECT typeof(copy_date) FROM processed_files")}
+        assert types == {"integer"}
+
+        # Deleting a record keeps the counters in sync
+        db.connection.execute("DELETE FROM processed_files WHERE filename = 'old1.txt'")
+        assert db.count_processed_files() == 1
+
+        db.close()
+
+    def test_get_processed_files_uses_covering_index(self, temp_db):
+        """Test that listing processed files is served by the covering index"""
+        db = DatabaseManager(temp_db)
+
+        db.add_processed_file(
+            filename="listed.txt",
+            source_path="/source/listed.txt",
+            target_path="/target/listed.txt",
+            size=100,
+            copy_date=datetime.now()
+        )
+
+        files = db.get_processed_files(limit=10)
+        assert files == [{'filename': "listed.txt", 'size': 100, 'copy_date': files[0]['copy_date']}]
+
+        plan = db.connection.execute("""
+            EXPLAIN QUERY PLAN
+            SELECT filename, size, copy_date FROM processed_files
+            ORDER BY copy_date DESC LIMIT 10
+        """).fetchall()
+        assert any("COVERING INDEX idx_copy_date_incl" in row[3] for row in plan)
+
+        db.close()
+
     def test_check_integrity(self, temp_db):
         """Test database integrity check"""
         db = DatabaseManager(temp_db)
@@ -403,6 +1037,103 @@ class TestStatistics:
         db.close()
 
 
+class TestCommandLine:
+    """Test the command line interface"""
+
+    def test_bare_invocation_runs_batch(self, cli_config, temp_dirs):
+        """Test that running without a command copies the next batch"""
+        _, target_dir = temp_dirs
+        result = CliRunner().invoke(main, ["--config", cli_config])
+
+        assert result.exit_code == 0, result.output
+        assert sorted(os.listdir(target_dir)) == ["file1.txt", "file2.jpg", "file3.mp4"]
+
+    def test_json_output(self, cli_config):
+        """Test the JSON output of run, stats and list-processed"""
+        runner = CliRunner()
+
+        result = runner.invoke(main, ["--config", cli_config, "--json", "run"])
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.stdout)['processed'] == 3
+
+        result = runner.invoke(main, ["--config", cli_config, "--json", "stats"])
+        assert result.exit_code == 0, result.output
+        statistics = json.loads(result.stdout)
+        assert statistics['total_files'] == 3
+        assert statistics['total_errors'] == 0
+
+        result = runner.invoke(main, ["--config", cli_config, "--json", "list-processed"])
+        assert result.exit_code == 0, result.output
+        files = json.loads(result.stdout)
+        assert sorted(f['filename'] for f in files) == ["file1.txt", "file2.jpg", "file3.mp4"]
+
+    def test_clean_orphans_dry_run(self, cli_config, temp_dirs):
+        """Test that clean-orphans --dry-run leaves orphan files in place"""
+        _, target_dir = temp_dirs
+        orphan = Path(target_dir) / "orphan.txt"
+        orphan.write_text("orphan")
+
+        result = CliRunner().invoke(
+            main, ["--config", cli_config, "--json", "clean-orphans", "--dry-run"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.stdout) == {'deleted': 1}
+        assert orphan.exists()
+
+    def test_hash_settings_from_configuration(self, cli_config, tmp_path, monkeypatch):
+        """Test that hash.compute and hash.verify apply without the CLI flags"""
+        with open(cli_config, "a") as config_file:
+            config_file.write("hash:\n  compute: true\n  verify: true\n")
+
+        verified = []
+        verify_copy = FileProcessor._verify_copy
+
+        def recording_verify(self, target_path, file_hash):
+            verified.append(os.path.basename(target_path))
+            return verify_copy(self, target_path, file_hash)
+        monkeypatch.setattr(FileProcessor, "_verify_copy", recording_verify)
+
+        result = CliRunner().invoke(main, ["--config", cli_config, "--json", "run"])
+
+        assert result.exit_code == 0, result.output
+        assert sorted(verified) == ["file1.txt", "file2.jpg", "file3.mp4"]
+        with sqlite3.connect(tmp_path / "tracker.db") as conn:
+            hashes = [row[0] for row in conn.execute("SELECT hash FROM processed_files")]
+        assert len(hashes) == 3 and all(hashes)
+
+    def test_exit_code_configuration_error(self, cli_config, monkeypatch):
+        """Test that a configuration error exits with code 1"""
+        monkeypatch.delenv("TARGET_DIR")
+        result = CliRunner().invoke(main, ["--config", cli_config, "stats"])
+
+        assert result.exit_code == 1
+        assert "TARGET_DIR" in result.output
+
+    def test_exit_code_copy_errors(self, cli_config, temp_dirs):
+        """Test that copy errors exit with code 1"""
+        _, target_dir = temp_dirs
+        (Path(target_dir) / "file1.txt").write_text("existing")
+
+        result = CliRunner().invoke(main, ["--config", cli_config, "--json", "run"])
+
+        assert result.exit_code == 1
+        output = json.loads(result.stdout)
+        assert output['processed'] == 2
+        assert output['errors'] == 1
+
+    def test_exit_code_unexpected_error(self, cli_config, monkeypatch):
+        """Test that an unexpected error exits with code 2"""
+        def failing_statistics(self):
+            raise RuntimeError("database exploded")
+        monkeypatch.setattr(DatabaseManager, "get_statistics", failing_statistics)
+
+        result = CliRunner().invoke(main, ["--config", cli_config, "--json", "stats"])
+
+        assert result.exit_code == 2
+        assert json.loads(result.stdout) == {'error': "database exploded", 'type': "RuntimeError"}
+
+
 if __name__ == "__main__":
     # Run tests with pytest
     pytest.main([__file__, "-v"])
\ No newline at end of file